@@ -6,10 +6,21 @@ from django import forms
 from django.utils import timezone
 
 from .models import EmailVerification
+from .paginators import ApproxCountPaginator
 
 User = get_user_model()
 
 
+def _chunked_update(queryset, batch_size=5000, **fields):
+    """
+    Apply `fields` to `queryset` in primary-key batches so large admin
+    selections never hold row locks on the whole set in one UPDATE.
+    """
+    pks = list(queryset.values_list("pk", flat=True))
+    for i in range(0, len(pks), batch_size):
+        queryset.model.objects.filter(pk__in=pks[i:i + batch_size]).update(**fields)
+
+
 class UserCreationForm(forms.ModelForm):
     password1 = forms.CharField(label="Password", widget=forms.PasswordInput, required=False)
     password2 = forms.CharField(label="Password confirmation", widget=forms.PasswordInput, required=False)
@@ -64,6 +75,8 @@ class UserAdmin(BaseUserAdmin):
     )
     search_fields = ("email", "first_name", "last_name")
     ordering = ("-date_joined",)
+    # Skip the second COUNT(*) over the whole table when a filter is applied
+    show_full_result_count = False
     readonly_fields = ("date_joined", "last_login", "deactivated_at")
 
     fieldsets = (
@@ -95,43 +108,43 @@ class UserAdmin(BaseUserAdmin):
 
     @admin.action(description="Make selected users STAFF")
     def make_staff(self, request, queryset):
-        queryset.update(is_staff=True)
+        _chunked_update(queryset, is_staff=True)
 
     @admin.action(description="Remove STAFF from selected users")
     def remove_staff(self, request, queryset):
-        queryset.update(is_staff=False)
+        _chunked_update(queryset, is_staff=False)
 
     @admin.action(description="Make selected users SUPERUSER")
     def make_superuser(self, request, queryset):
-        queryset.update(is_superuser=True, is_staff=True)
+        _chunked_update(queryset, is_superuser=True, is_staff=True)
 
     @admin.action(description="Remove SUPERUSER from selected users")
     def remove_superuser(self, request, queryset):
-        queryset.update(is_superuser=False)
+        _chunked_update(queryset, is_superuser=False)
 
     @admin.action(description="Set role = ADMIN (does NOT auto grant staff)")
     def set_role_admin(self, request, queryset):
-        queryset.update(role=User.Roles.ADMIN)
+        _chunked_update(queryset, role=User.Roles.ADMIN)
 
     @admin.action(description="Set role = USER")
     def set_role_user(self, request, queryset):
-        queryset.update(role=User.Roles.USER)
+        _chunked_update(queryset, role=User.Roles.USER)
 
     @admin.action(description="Block selected users")
     def block_users(self, request, queryset):
-        queryset.update(is_blocked=True)
+        _chunked_update(queryset, is_blocked=True)
 
     @admin.action(description="Unblock selected users")
     def unblock_users(self, request, queryset):
-        queryset.update(is_blocked=False)
+        _chunked_update(queryset, is_blocked=False)
 
     @admin.action(description="Deactivate selected users (sets deactivated_at)")
     def deactivate_users(self, request, queryset):
-        queryset.update(is_active=False, deactivated_at=timezone.now())
+        _chunked_update(queryset, is_active=False, deactivated_at=timezone.now())
 
     @admin.action(description="Reactivate selected users (clears deactivated_at)")
     def reactivate_users(self, request, queryset):
-        queryset.update(is_active=True, deactivated_at=None)
+        _chunked_update(queryset, is_active=True, deactivated_at=None)
 
 
 @admin.register(EmailVerification)
@@ -141,6 +154,8 @@ class EmailVerificationAdmin(admin.ModelAdmin):
     search_fields = ("email", "code")
     readonly_fields = ("created_at",)
     ordering = ("-created_at",)
+    paginator = ApproxCountPaginator
+    show_full_result_count = False
 
     actions = ["mark_used"]
 
@@ -0,0 +1,35 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db.models import Q
+from django.utils import timezone
+from accounts.models import EmailVerification
+
+
+class Command(BaseCommand):
+    help = 'Purge used and long-expired email verification codes'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=10000,
+            help='Rows deleted per statement (keeps lock time bounded)',
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        stale = EmailVerification.objects.filter(
+            Q(is_used=True) | Q(expires_at__lt=timezone.now() - timedelta(days=1))
+        )
+
+        deleted = 0
+        while True:
+            ids = list(stale.values_list('pk', flat=True)[:batch_size])
+            if not ids:
+                break
+            deleted += EmailVerification.objects.filter(pk__in=ids).delete()[0]
+
+        self.stdout.write(
+            self.style.SUCCESS(f'Deleted {deleted} stale email verifications')
+        )
@@ -0,0 +1,38 @@
+# Generated by Django 5.2.8 on 2026-10-16 09:12
+
+from django.db import migrations, models
+
+
+def retire_duplicate_active_codes(apps, schema_editor):
+    """Keep only the newest unused code per (email, verification_type)."""
+    EmailVerification = apps.get_model('accounts', 'EmailVerification')
+    seen = set()
+    stale = []
+    rows = (
+        EmailVerification.objects.filter(is_used=False)
+        .order_by('email', 'verification_type', '-created_at', '-pk')
+        .values_list('pk', 'email', 'verification_type')
+    )
+    for pk, email, verification_type in rows:
+        key = (email, verification_type)
+        if key in seen:
+            stale.append(pk)
+        else:
+            seen.add(key)
+    if stale:
+        EmailVerification.objects.filter(pk__in=stale).update(is_used=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0004_user_auth_provider_user_avatar_url'),
+    ]
+
+    operations = [
+        migrations.RunPython(retire_duplicate_active_codes, reverse_code=migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='emailverification',
+            constraint=models.UniqueConstraint(condition=models.Q(('is_used', False)), fields=('email', 'verification_type'), name='uniq_active_verif'),
+        ),
+    ]
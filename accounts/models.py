@@ -1,6 +1,7 @@
 # accounts/models.py
 from django.contrib.auth.models import AbstractUser, BaseUserManager
 from django.db import models
+from django.db.models import Q
 from django.utils import timezone
 
 
@@ -131,5 +132,14 @@ class EmailVerification(models.Model):
             models.Index(fields=["email", "code"]),
             models.Index(fields=["email", "verification_type", "is_used"]),
         ]
+        constraints = [
+            # At most one live code per email + flow; lets us upsert instead
+            # of delete + insert when a new code is requested.
+            models.UniqueConstraint(
+                fields=["email", "verification_type"],
+                condition=Q(is_used=False),
+                name="uniq_active_verif",
+            ),
+        ]
         verbose_name = "Email verification"
         verbose_name_plural = "Email verifications"
@@ -0,0 +1,28 @@
+# accounts/paginators.py
+from django.core.paginator import Paginator
+from django.db import connections
+from django.utils.functional import cached_property
+
+
+class ApproxCountPaginator(Paginator):
+    """
+    On PostgreSQL, unfiltered changelists read the planner's row estimate
+    from pg_class instead of running COUNT(*) over the whole table.
+    Filtered lists (and other databases) still get an exact count.
+    """
+
+    @cached_property
+    def count(self):
+        qs = self.object_list
+        connection = connections[qs.db]
+        if connection.vendor == "postgresql" and not qs.query.where:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    "SELECT reltuples::bigint FROM pg_class WHERE relname = %s",
+                    [qs.model._meta.db_table],
+                )
+                row = cursor.fetchone()
+            # reltuples is -1/0 until the table has been analyzed
+            if row and row[0] > 0:
+                return row[0]
+        return super().count
@@ -2,8 +2,8 @@
 from django.contrib.auth import get_user_model
 from django.contrib.auth.hashers import make_password
 from django.contrib.auth.password_validation import validate_password
-from django.core.mail import send_mail
-from django.conf import settings
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db import transaction
 
 from rest_framework import serializers
 from rest_framework.exceptions import AuthenticationFailed, ValidationError
@@ -11,9 +11,11 @@ from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
 
 from django.utils import timezone
 from datetime import timedelta
-import random
+from operator import attrgetter
+from secrets import randbelow
 
 from .models import EmailVerification
+from .tasks import enqueue, send_verification_email, send_password_reset_email
 
 User = get_user_model()
 
@@ -25,6 +27,21 @@ class UserSerializer(serializers.ModelSerializer):
         read_only_fields = ["id", "role", "is_blocked", "is_active","auth_provider","avatar_url"]
 
 
+# Resolved once at import: UserSerializer's field list and a C-level getter
+# that reads all of them in one call
+_USER_FIELDS = tuple(UserSerializer.Meta.fields)
+_get_user_values = attrgetter(*_USER_FIELDS)
+
+
+def serialize_user(user):
+    """
+    Plain-dict equivalent of UserSerializer(user).data for the login and
+    /me/ hot paths; every field is a plain model attribute, so there is
+    nothing for DRF to do.
+    """
+    return dict(zip(_USER_FIELDS, _get_user_values(user)))
+
+
 class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
     """
     Custom login:
@@ -44,8 +61,12 @@ class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
         password = attrs.get("password")
 
         try:
-            user = User.objects.get(email=email)
+            # Only the columns needed for the checks and the response payload
+            user = User.objects.only("password", *UserSerializer.Meta.fields).get(email=email)
         except User.DoesNotExist:
+            # Run the password hasher anyway so unknown emails take as long
+            # as wrong passwords (same trick as Django's ModelBackend).
+            User().set_password(password)
             raise AuthenticationFailed("Invalid email or password")
 
         if not user.check_password(password):
@@ -56,7 +77,7 @@ class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
                 "Your account has been deactivated. Please contact support."
             )
 
-        if getattr(user, "is_blocked", False):
+        if user.is_blocked:
             raise AuthenticationFailed(
                 "Your account has been blocked. Please contact support."
             )
@@ -65,7 +86,7 @@ class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
         data = {
             "refresh": str(refresh),
             "access": str(refresh.access_token),
-            "user": UserSerializer(user).data,
+            "user": serialize_user(user),
         }
         return data
 
@@ -120,50 +141,29 @@ class EmailRegisterInitiateSerializer(serializers.Serializer):
         email = validated_data["email"]
         password = validated_data["password"]
 
-        # Clean old unused registration codes
-        EmailVerification.objects.filter(
-            email=email,
-            is_used=False,
-            verification_type=EmailVerification.VerificationType.REGISTRATION,
-        ).delete()
-
-        code = f"{random.randint(0, 999999):06d}"
-        password_hash = make_password(password)
-        expires_at = timezone.now() + timedelta(minutes=10)
-
-        record = EmailVerification.objects.create(
-            email=email,
-            password_hash=password_hash,
-            role=User.Roles.USER,
-            code=code,
-            verification_type=EmailVerification.VerificationType.REGISTRATION,
-            expires_at=expires_at,
-        )
+        with transaction.atomic():
+            code = f"{randbelow(1_000_000):06d}"
+            password_hash = make_password(password)
+            now = timezone.now()
 
-        self._send_verification_email(email, code)
-        return record
-
-    def _send_verification_email(self, email, code):
-        subject = "Verify your email"
-        message = f"""
-        Hello,
-
-        Your verification code is: {code}
-
-        This code will expire in 10 minutes.
+            # Re-requesting a code overwrites the live one in place
+            record, _ = EmailVerification.objects.update_or_create(
+                email=email,
+                verification_type=EmailVerification.VerificationType.REGISTRATION,
+                is_used=False,
+                defaults={
+                    "password_hash": password_hash,
+                    "role": User.Roles.USER,
+                    "code": code,
+                    "created_at": now,
+                    "expires_at": now + timedelta(minutes=10),
+                },
+            )
 
-        If you didn't request this, you can ignore this email.
+            # Delivered off the request thread, only once the code is committed
+            enqueue(send_verification_email, email, code)
 
-        Best regards,
-        Resume Builder Team
-        """
-        send_mail(
-            subject,
-            message.strip(),
-            settings.DEFAULT_FROM_EMAIL,
-            [email],
-            fail_silently=False,
-        )
+        return record
 
 
 class EmailRegisterVerifySerializer(serializers.Serializer):
@@ -180,14 +180,18 @@ class EmailRegisterVerifySerializer(serializers.Serializer):
         email = attrs.get("email")
         code = attrs.get("code")
 
-        try:
-            record = EmailVerification.objects.filter(
+        record = (
+            EmailVerification.objects.filter(
                 email=email,
                 code=code,
                 is_used=False,
                 verification_type=EmailVerification.VerificationType.REGISTRATION,
-            ).latest("created_at")
-        except EmailVerification.DoesNotExist:
+            )
+            .only("id", "email", "role", "password_hash", "expires_at")
+            .order_by("-created_at")
+            .first()
+        )
+        if record is None:
             raise ValidationError("Invalid verification code.")
 
         if record.is_expired():
@@ -210,52 +214,29 @@ class ForgotPasswordSerializer(serializers.Serializer):
 
     def create(self, validated_data):
         email = validated_data["email"]
-        user = User.objects.filter(email=email, is_active=True).first()
-        if not user:
+        if not User.objects.filter(email=email, is_active=True).exists():
             # Silent success
             return {"email": email}
 
-        EmailVerification.objects.filter(
-            email=email,
-            is_used=False,
-            verification_type=EmailVerification.VerificationType.PASSWORD_RESET,
-        ).delete()
+        with transaction.atomic():
+            code = f"{randbelow(1_000_000):06d}"
+            now = timezone.now()
 
-        code = f"{random.randint(0, 999999):06d}"
-        expires_at = timezone.now() + timedelta(minutes=15)
+            record, _ = EmailVerification.objects.update_or_create(
+                email=email,
+                verification_type=EmailVerification.VerificationType.PASSWORD_RESET,
+                is_used=False,
+                defaults={
+                    "code": code,
+                    "created_at": now,
+                    "expires_at": now + timedelta(minutes=15),
+                },
+            )
 
-        record = EmailVerification.objects.create(
-            email=email,
-            code=code,
-            verification_type=EmailVerification.VerificationType.PASSWORD_RESET,
-            expires_at=expires_at,
-        )
+            enqueue(send_password_reset_email, email, code)
 
-        self._send_reset_email(email, code)
         return record
 
-    def _send_reset_email(self, email, code):
-        subject = "Password reset request"
-        message = f"""
-        Hello,
-
-        You requested a password reset. Your reset code is: {code}
-
-        This code will expire in 15 minutes.
-
-        If you didn't request a password reset, you can ignore this email.
-
-        Best regards,
-        Resume Builder Team
-        """
-        send_mail(
-            subject,
-            message.strip(),
-            settings.DEFAULT_FROM_EMAIL,
-            [email],
-            fail_silently=False,
-        )
-
 
 class ResetPasswordSerializer(serializers.Serializer):
     """
@@ -270,19 +251,27 @@ class ResetPasswordSerializer(serializers.Serializer):
         code = attrs.get("code")
         new_password = attrs.get("new_password")
 
-        user = User.objects.filter(email=email, is_active=True).first()
+        user = (
+            User.objects.filter(email=email, is_active=True)
+            .only("id", "email", "password")
+            .first()
+        )
         if not user:
             # generic error, don't leak details
             raise ValidationError("Invalid reset request.")
 
-        try:
-            record = EmailVerification.objects.filter(
+        record = (
+            EmailVerification.objects.filter(
                 email=email,
                 code=code,
                 is_used=False,
                 verification_type=EmailVerification.VerificationType.PASSWORD_RESET,
-            ).latest("created_at")
-        except EmailVerification.DoesNotExist:
+            )
+            .only("id", "expires_at")
+            .order_by("-created_at")
+            .first()
+        )
+        if record is None:
             raise ValidationError("Invalid reset code.")
 
         if record.is_expired():
@@ -296,20 +285,18 @@ class ResetPasswordSerializer(serializers.Serializer):
 
     def save(self):
         user = self.validated_data["user"]
-        record = self.validated_data["record"]
         new_password = self.validated_data["new_password"]
 
-        user.set_password(new_password)
-        user.save()
-
-        record.mark_used()
+        with transaction.atomic():
+            user.set_password(new_password)
+            user.save(update_fields=["password"])
 
-        # Clean other unused reset codes for this email
-        EmailVerification.objects.filter(
-            email=user.email,
-            is_used=False,
-            verification_type=EmailVerification.VerificationType.PASSWORD_RESET,
-        ).delete()
+            # Consumes this code and invalidates any other live reset codes
+            EmailVerification.objects.filter(
+                email=user.email,
+                is_used=False,
+                verification_type=EmailVerification.VerificationType.PASSWORD_RESET,
+            ).update(is_used=True)
 
 
 class ChangePasswordSerializer(serializers.Serializer):
@@ -319,18 +306,28 @@ class ChangePasswordSerializer(serializers.Serializer):
     old_password = serializers.CharField(write_only=True)
     new_password = serializers.CharField(write_only=True, min_length=8)
 
-    def validate_old_password(self, value):
+    def validate(self, attrs):
+        # Resolve request.user once and check both passwords in one pass,
+        # still reporting errors under their own field names.
         user = self.context["request"].user
-        if not user.check_password(value):
-            raise ValidationError("Current password is incorrect.")
-        return value
+        errors = {}
 
-    def validate_new_password(self, value):
-        validate_password(value)
-        return value
+        if not user.check_password(attrs["old_password"]):
+            errors["old_password"] = ["Current password is incorrect."]
+
+        try:
+            validate_password(attrs["new_password"])
+        except DjangoValidationError as e:
+            errors["new_password"] = list(e.messages)
+
+        if errors:
+            raise ValidationError(errors)
+
+        attrs["user"] = user
+        return attrs
 
     def save(self):
-        user = self.context["request"].user
+        user = self.validated_data["user"]
         new_password = self.validated_data["new_password"]
         user.set_password(new_password)
-        user.save()
+        user.save(update_fields=["password"])
@@ -0,0 +1,16 @@
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from allauth.socialaccount.models import SocialAccount
+
+# Per-user list of connected social providers, read by the profile views
+PROVIDERS_CACHE_KEY = "profile:providers:{}"
+
+
+@receiver(post_save, sender=SocialAccount)
+@receiver(post_delete, sender=SocialAccount)
+def invalidate_connected_providers(sender, instance, **kwargs):
+    """
+    Drop the cached provider list when a social account is linked or removed.
+    """
+    cache.delete(PROVIDERS_CACHE_KEY.format(instance.user_id))
@@ -1,17 +1,64 @@
 # accounts/social_serializers.py
 
+import hashlib
 import logging
-import requests
+import time
+
+import httpx
+from google.auth import exceptions as google_exceptions
+from google.auth import jwt as google_jwt
 from django.conf import settings
+from django.core.cache import cache
 from django.contrib.auth import get_user_model
 from rest_framework import serializers
 from rest_framework.exceptions import AuthenticationFailed, ValidationError
 from allauth.socialaccount.models import SocialAccount
 
+from .serializers import UserSerializer
+from .signals import PROVIDERS_CACHE_KEY
+
 logger = logging.getLogger(__name__)
 
 User = get_user_model()
 
+# Shared across requests so TLS connections to Google/Facebook are reused.
+# The transport retries failed connects (not HTTP error statuses).
+# Tight timeouts: a slow provider must not pin a worker for seconds.
+_HTTP = httpx.Client(
+    timeout=httpx.Timeout(2.0, connect=1.0),
+    transport=httpx.HTTPTransport(
+        retries=2,
+        limits=httpx.Limits(max_keepalive_connections=64, max_connections=128),
+    ),
+)
+
+GOOGLE_CLIENT_ID = getattr(settings, "GOOGLE_CLIENT_ID", None)
+
+# PEM certificates Google signs ID tokens with, keyed by `kid`
+GOOGLE_CERTS_URL = "https://www.googleapis.com/oauth2/v1/certs"
+GOOGLE_CERTS_CACHE_KEY = "soc:google:certs"
+GOOGLE_CERTS_DEFAULT_MAX_AGE = 3600
+
+# Facebook access tokens carry no expiry we can see from /me, so keep it short
+FACEBOOK_PROFILE_CACHE_SECONDS = 300
+
+# Rejected tokens are remembered briefly so replays don't hit the provider;
+# kept short so a token refused by a provider hiccup works again quickly
+INVALID_TOKEN_CACHE_SECONDS = 60
+
+# Circuit breaker: after this many consecutive provider failures, stop
+# calling it for BREAKER_RESET_SECONDS and fail fast instead
+BREAKER_FAIL_MAX = 5
+BREAKER_RESET_SECONDS = 30
+
+# Columns a social login actually reads: the active/blocked checks, the
+# token claims and the serialized user in the response
+SOCIAL_USER_FIELDS = tuple(UserSerializer.Meta.fields)
+
+
+class InvalidSocialToken(ValidationError):
+    """The provider (or the signature check) rejected the token itself."""
+
 
 class BaseSocialSerializer(serializers.Serializer):
     """
@@ -25,36 +72,128 @@ class BaseSocialSerializer(serializers.Serializer):
 
     provider_name = None  # override in subclasses
 
+    def _verify_cached(self, token):
+        """
+        Return the provider's verified payload for `token`.
+
+        Only successful verifications are cached (never the User row), for as
+        long as `_fetch_verified` says the payload stays valid, so repeat
+        logins with the same token skip the provider round-trip. Tokens the
+        provider rejects are remembered for INVALID_TOKEN_CACHE_SECONDS and
+        refused without another call.
+        """
+        digest = hashlib.blake2b(token.encode(), digest_size=16).hexdigest()
+        cache_key = f"soc:{self.provider_name}:{digest}"
+        bad_key = f"soc:bad:{self.provider_name}:{digest}"
+
+        data = cache.get(cache_key)
+        if data is not None:
+            return data
+
+        rejected = cache.get(bad_key)
+        if rejected is not None:
+            raise InvalidSocialToken(rejected)
+
+        try:
+            data, ttl = self._fetch_verified(token)
+        except InvalidSocialToken as e:
+            cache.set(bad_key, str(e.detail[0]), timeout=INVALID_TOKEN_CACHE_SECONDS)
+            raise
+        if ttl > 0:
+            cache.set(cache_key, data, timeout=ttl)
+        return data
+
+    def _fetch_verified(self, token):
+        """Call the provider; return (payload, cache_ttl_seconds)."""
+        raise NotImplementedError
+
+    def _provider_get(self, url, params=None):
+        """
+        GET `url` on the shared client, behind a per-provider circuit breaker.
+
+        Failure counts live in the cache so every worker sees the same state.
+        Transport errors and 5xx responses count as failures; any other
+        response closes the breaker again.
+        """
+        breaker_key = f"soc:breaker:{self.provider_name}"
+        failures = cache.get(breaker_key, 0)
+        if failures >= BREAKER_FAIL_MAX:
+            raise ValidationError("Social provider temporarily unavailable.")
+
+        try:
+            resp = _HTTP.get(url, params=params)
+        except httpx.HTTPError:
+            self._record_provider_failure(breaker_key, failures)
+            raise
+
+        if resp.status_code >= 500:
+            self._record_provider_failure(breaker_key, failures)
+        elif failures:
+            cache.delete(breaker_key)
+        return resp
+
+    def _record_provider_failure(self, breaker_key, failures):
+        failures += 1
+        if failures >= BREAKER_FAIL_MAX:
+            logger.error(
+                "%s verification failing; pausing calls for %ss",
+                self.provider_name,
+                BREAKER_RESET_SECONDS,
+            )
+        cache.set(breaker_key, failures, timeout=BREAKER_RESET_SECONDS)
+
     def get_or_create_social_user(self, email, uid, defaults):
         """
         Use allauth's SocialAccount to link provider account <-> User.
         """
-        user, created_user = User.objects.get_or_create(
+        if self.provider_name == "google":
+            provider = User.AuthProvider.GOOGLE
+        else:
+            provider = User.AuthProvider.FACEBOOK
+
+        # Returning users: one query resolves the SocialAccount and its user
+        social = (
+            SocialAccount.objects.select_related("user")
+            .only("id", "user", *(f"user__{f}" for f in SOCIAL_USER_FIELDS))
+            .filter(provider=self.provider_name, uid=uid)
+            .first()
+        )
+        if social is not None:
+            user = social.user
+            if user.auth_provider != provider:
+                user.auth_provider = provider
+                user.save(update_fields=["auth_provider"])
+            return user, False
+
+        # New users are created with the provider already set
+        user, created_user = User.objects.only(*SOCIAL_USER_FIELDS).get_or_create(
             email=email,
-            defaults=defaults,
+            defaults={**defaults, "auth_provider": provider},
         )
 
-        # Ensure we record provider
-        if self.provider_name == "google":
-            user.auth_provider = User.AuthProvider.GOOGLE
-        elif self.provider_name == "facebook":
-            user.auth_provider = User.AuthProvider.FACEBOOK
-        user.save()
-
-        # Create or get SocialAccount entry
-        social, created_social = SocialAccount.objects.get_or_create(
-            user=user,
-            provider=self.provider_name,
-            uid=uid,
+        # Existing users: only write when the provider actually changed
+        if not created_user and user.auth_provider != provider:
+            user.auth_provider = provider
+            user.save(update_fields=["auth_provider"])
+
+        # First login with this provider: link the SocialAccount.
+        # INSERT ... ON CONFLICT DO NOTHING: a concurrent login for the
+        # same (provider, uid) is a no-op rather than an IntegrityError.
+        SocialAccount.objects.bulk_create(
+            [SocialAccount(user=user, provider=self.provider_name, uid=uid)],
+            ignore_conflicts=True,
         )
+        # bulk_create sends no post_save, so drop the profile cache here
+        cache.delete(PROVIDERS_CACHE_KEY.format(user.pk))
 
-        return user, (created_user or created_social)
+        return user, True
 
 
 class GoogleAuthSerializer(BaseSocialSerializer):
     """
     Accepts a Google ID token (from @react-oauth/google),
-    verifies it via Google's tokeninfo endpoint, then links/creates a user
+    verifies its signature locally against Google's published certs
+    (tokeninfo endpoint for non-JWT tokens), then links/creates a user
     + SocialAccount.
     """
     provider_name = "google"
@@ -67,31 +206,12 @@ class GoogleAuthSerializer(BaseSocialSerializer):
         if not raw_token:
             raise ValidationError("Google id_token is required.")
 
-        # 1) Ask Google to validate the ID token
-        try:
-            resp = requests.get(
-                "https://oauth2.googleapis.com/tokeninfo",
-                params={"id_token": raw_token},
-                timeout=5,
-            )
-        except requests.RequestException as e:
-            logger.error("Error calling Google tokeninfo: %s", e)
-            raise ValidationError("Could not contact Google token endpoint.")
-
-        if resp.status_code != 200:
-            logger.warning(
-                "Google tokeninfo returned non-200: %s, body=%s",
-                resp.status_code,
-                resp.text,
-            )
-            raise ValidationError("Invalid Google token.")
-
-        data = resp.json()
-        logger.debug("Google tokeninfo data: %s", data)
+        # 1) Ask Google to validate the ID token (cached per token)
+        data = self._verify_cached(raw_token)
 
         # 2) Audience (client_id) must match our app’s client id
         aud = data.get("aud")
-        expected_aud = getattr(settings, "GOOGLE_CLIENT_ID", None)
+        expected_aud = GOOGLE_CLIENT_ID
         if expected_aud and aud != expected_aud:
             logger.warning(
                 "Google token audience mismatch: aud=%s expected=%s",
@@ -108,7 +228,7 @@ class GoogleAuthSerializer(BaseSocialSerializer):
 
         # 4) Extract user info
         email = data.get("email")
-        # tokeninfo returns 'true'/'false' strings
+        # tokeninfo returns 'true'/'false' strings, decoded JWTs a bool
         email_verified = str(data.get("email_verified", "true")).lower() == "true"
         sub = data.get("sub")  # unique Google user id
 
@@ -134,13 +254,90 @@ class GoogleAuthSerializer(BaseSocialSerializer):
         if not user.is_active:
             raise AuthenticationFailed("Account deactivated. Please contact support.")
 
-        if getattr(user, "is_blocked", False):
+        if user.is_blocked:
             raise AuthenticationFailed("Account blocked. Please contact support.")
 
         attrs["user"] = user
         attrs["is_new"] = is_new
         return attrs
 
+    def _fetch_verified(self, raw_token):
+        """
+        Verify the token and return (payload, ttl). ID tokens (JWTs) are
+        checked locally against Google's cached signing certs; anything else
+        falls back to the tokeninfo endpoint. Cacheable until 60s before the
+        token expires.
+        """
+        if raw_token.count(".") == 2:
+            data = self._decode_id_token(raw_token)
+        else:
+            data = self._fetch_tokeninfo(raw_token)
+
+        try:
+            ttl = int(data.get("exp")) - int(time.time()) - 60
+        except (TypeError, ValueError):
+            ttl = 0
+        return data, ttl
+
+    def _decode_id_token(self, raw_token):
+        """Check signature, exp and iat of a Google ID token without a network call."""
+        try:
+            return google_jwt.decode(
+                raw_token,
+                certs=self._google_certs(),
+                clock_skew_in_seconds=10,
+            )
+        except (ValueError, google_exceptions.GoogleAuthError) as e:
+            logger.warning("Google ID token rejected: %s", e)
+            raise InvalidSocialToken("Invalid Google token.")
+
+    def _google_certs(self):
+        """Google's signing certs, cached for as long as Google allows."""
+        certs = cache.get(GOOGLE_CERTS_CACHE_KEY)
+        if certs is not None:
+            return certs
+
+        try:
+            resp = self._provider_get(GOOGLE_CERTS_URL)
+            resp.raise_for_status()
+        except httpx.HTTPError as e:
+            logger.error("Error fetching Google signing certs: %s", e)
+            raise ValidationError("Could not contact Google token endpoint.")
+
+        certs = resp.json()
+        max_age = GOOGLE_CERTS_DEFAULT_MAX_AGE
+        for directive in resp.headers.get("cache-control", "").split(","):
+            name, _, value = directive.strip().partition("=")
+            if name == "max-age" and value.isdigit():
+                max_age = int(value)
+        cache.set(GOOGLE_CERTS_CACHE_KEY, certs, timeout=max_age)
+        return certs
+
+    def _fetch_tokeninfo(self, raw_token):
+        """Remote validation via Google's tokeninfo endpoint."""
+        try:
+            resp = self._provider_get(
+                "https://oauth2.googleapis.com/tokeninfo",
+                params={"id_token": raw_token},
+            )
+        except httpx.HTTPError as e:
+            logger.error("Error calling Google tokeninfo: %s", e)
+            raise ValidationError("Could not contact Google token endpoint.")
+
+        if resp.status_code != 200:
+            logger.warning(
+                "Google tokeninfo returned non-200: %s, body=%s",
+                resp.status_code,
+                resp.text,
+            )
+            if resp.status_code < 500:
+                raise InvalidSocialToken("Invalid Google token.")
+            raise ValidationError("Invalid Google token.")
+
+        data = resp.json()
+        logger.debug("Google tokeninfo data: %s", data)
+        return data
+
 
 class FacebookAuthSerializer(BaseSocialSerializer):
     """
@@ -155,23 +352,7 @@ class FacebookAuthSerializer(BaseSocialSerializer):
     def validate(self, attrs):
         token = attrs["access_token"]
 
-        resp = requests.get(
-            "https://graph.facebook.com/me",
-            params={
-                "access_token": token,
-                "fields": "id,email,first_name,last_name,picture",
-            },
-            timeout=5,
-        )
-        if resp.status_code != 200:
-            logger.warning(
-                "Facebook token validation failed: %s, body=%s",
-                resp.status_code,
-                resp.text,
-            )
-            raise ValidationError("Invalid Facebook access token.")
-
-        data = resp.json()
+        data = self._verify_cached(token)
         email = data.get("email")
         uid = data.get("id")
 
@@ -197,9 +378,38 @@ class FacebookAuthSerializer(BaseSocialSerializer):
         if not user.is_active:
             raise AuthenticationFailed("Account deactivated. Please contact support.")
 
-        if getattr(user, "is_blocked", False):
+        if user.is_blocked:
             raise AuthenticationFailed("Account blocked. Please contact support.")
 
         attrs["user"] = user
         attrs["is_new"] = is_new
         return attrs
+
+    def _fetch_verified(self, token):
+        """
+        Validate the access token against Graph API /me.
+        /me does not expose the token expiry, so cache it briefly.
+        """
+        try:
+            resp = self._provider_get(
+                "https://graph.facebook.com/me",
+                params={
+                    "access_token": token,
+                    "fields": "id,email,first_name,last_name,picture",
+                },
+            )
+        except httpx.HTTPError as e:
+            logger.error("Error calling Facebook Graph API: %s", e)
+            raise ValidationError("Could not contact Facebook.")
+
+        if resp.status_code != 200:
+            logger.warning(
+                "Facebook token validation failed: %s, body=%s",
+                resp.status_code,
+                resp.text,
+            )
+            if resp.status_code < 500:
+                raise InvalidSocialToken("Invalid Facebook access token.")
+            raise ValidationError("Invalid Facebook access token.")
+
+        return resp.json(), FACEBOOK_PROFILE_CACHE_SECONDS
@@ -0,0 +1,63 @@
+# accounts/tasks.py
+import logging
+import threading
+
+from django.conf import settings
+from django.core.mail import send_mail
+from django.db import transaction
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_FROM_EMAIL = settings.DEFAULT_FROM_EMAIL
+
+_VERIFY_TMPL = (
+    "Hello,\n\n"
+    "Your verification code is: {code}\n\n"
+    "This code will expire in 10 minutes.\n\n"
+    "If you didn't request this, you can ignore this email.\n\n"
+    "Best regards,\n"
+    "Resume Builder Team"
+)
+
+_RESET_TMPL = (
+    "Hello,\n\n"
+    "You requested a password reset. Your reset code is: {code}\n\n"
+    "This code will expire in 15 minutes.\n\n"
+    "If you didn't request a password reset, you can ignore this email.\n\n"
+    "Best regards,\n"
+    "Resume Builder Team"
+)
+
+
+def enqueue(func, *args):
+    """
+    Run `func(*args)` in the background once the current transaction commits.
+
+    Keeps SMTP round-trips out of the request/response cycle, and makes sure
+    we never email a code whose EmailVerification row was rolled back.
+    """
+    def _start():
+        threading.Thread(target=func, args=args, daemon=True).start()
+
+    transaction.on_commit(_start)
+
+
+def send_verification_email(email, code):
+    _deliver("Verify your email", _VERIFY_TMPL.format(code=code), email)
+
+
+def send_password_reset_email(email, code):
+    _deliver("Password reset request", _RESET_TMPL.format(code=code), email)
+
+
+def _deliver(subject, message, email):
+    try:
+        send_mail(
+            subject,
+            message,
+            DEFAULT_FROM_EMAIL,
+            [email],
+            fail_silently=False,
+        )
+    except Exception:
+        logger.exception("Failed to send '%s' email to %s", subject, email)
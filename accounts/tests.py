@@ -1,3 +1,240 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.core import mail
+from django.core.management import call_command
+from django.utils import timezone
 from django.test import TestCase
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+from rest_framework import status
+from allauth.socialaccount.models import SocialAccount
+from accounts.models import EmailVerification
+from accounts.serializers import UserSerializer
+
+User = get_user_model()
+
+
+class RegisterFlowTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+
+    def test_register_init_defers_email_until_commit(self):
+        with self.captureOnCommitCallbacks() as callbacks:
+            response = self.client.post('/api/auth/register/', {
+                'email': 'new@test.com',
+                'password': 'Str0ng-pass-123'
+            })
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertTrue(EmailVerification.objects.filter(email='new@test.com').exists())
+        # Nothing is sent inside the request; delivery is queued for commit
+        self.assertEqual(len(mail.outbox), 0)
+        self.assertEqual(len(callbacks), 1)
+
+
+class ForgotPasswordTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            email='user@test.com',
+            password='testpass123'
+        )
+
+    def test_forgot_password_unknown_email_is_silent(self):
+        with self.captureOnCommitCallbacks() as callbacks:
+            response = self.client.post('/api/auth/forgot-password/', {
+                'email': 'nobody@test.com'
+            })
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(callbacks), 0)
+
+    def test_forgot_password_queues_reset_code(self):
+        with self.captureOnCommitCallbacks() as callbacks:
+            response = self.client.post('/api/auth/forgot-password/', {
+                'email': 'user@test.com'
+            })
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(callbacks), 1)
+        self.assertTrue(EmailVerification.objects.filter(
+            email='user@test.com',
+            verification_type=EmailVerification.VerificationType.PASSWORD_RESET,
+            is_used=False,
+        ).exists())
+
+
+class VerificationUpsertTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+
+    def test_repeat_register_init_keeps_single_live_code(self):
+        payload = {'email': 'again@test.com', 'password': 'Str0ng-pass-123'}
+        self.client.post('/api/auth/register/', payload)
+        self.client.post('/api/auth/register/', payload)
+        self.assertEqual(
+            EmailVerification.objects.filter(email='again@test.com', is_used=False).count(),
+            1
+        )
+
+
+class ResetPasswordTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            email='user@test.com',
+            password='testpass123'
+        )
+        self.client.post('/api/auth/forgot-password/', {'email': 'user@test.com'})
+        self.record = EmailVerification.objects.get(
+            email='user@test.com',
+            verification_type=EmailVerification.VerificationType.PASSWORD_RESET,
+        )
+
+    def test_reset_password_consumes_code(self):
+        response = self.client.post('/api/auth/reset-password/', {
+            'email': 'user@test.com',
+            'code': self.record.code,
+            'new_password': 'Brand-new-pass-456'
+        })
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.record.refresh_from_db()
+        self.assertTrue(self.record.is_used)
+        self.user.refresh_from_db()
+        self.assertTrue(self.user.check_password('Brand-new-pass-456'))
+
+        # The same code cannot be replayed
+        response = self.client.post('/api/auth/reset-password/', {
+            'email': 'user@test.com',
+            'code': self.record.code,
+            'new_password': 'Another-pass-789'
+        })
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class PurgeVerificationsCommandTests(TestCase):
+    def test_purges_used_and_expired_codes_only(self):
+        now = timezone.now()
+        EmailVerification.objects.create(
+            email='used@test.com', code='111111', is_used=True,
+            expires_at=now + timedelta(minutes=10)
+        )
+        EmailVerification.objects.create(
+            email='old@test.com', code='222222',
+            expires_at=now - timedelta(days=2)
+        )
+        live = EmailVerification.objects.create(
+            email='live@test.com', code='333333',
+            expires_at=now + timedelta(minutes=10)
+        )
+
+        call_command('purge_verifications', batch_size=1, stdout=StringIO())
+
+        self.assertEqual(list(EmailVerification.objects.values_list('pk', flat=True)), [live.pk])
+
+
+class ChangePasswordTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            email='user@test.com',
+            password='testpass123'
+        )
+        self.client.force_authenticate(user=self.user)
+
+    def test_wrong_old_password_reported_on_field(self):
+        response = self.client.post('/api/auth/change-password/', {
+            'old_password': 'wrong-pass',
+            'new_password': 'Brand-new-pass-456'
+        })
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('old_password', response.data)
+
+    def test_change_password(self):
+        response = self.client.post('/api/auth/change-password/', {
+            'old_password': 'testpass123',
+            'new_password': 'Brand-new-pass-456'
+        })
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.user.refresh_from_db()
+        self.assertTrue(self.user.check_password('Brand-new-pass-456'))
+
+
+class RegisterVerifyTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.client.post('/api/auth/register/', {
+            'email': 'verify@test.com',
+            'password': 'Str0ng-pass-123'
+        })
+        self.record = EmailVerification.objects.get(email='verify@test.com')
+
+    def test_verify_creates_user_with_registered_password(self):
+        response = self.client.post('/api/auth/register/', {
+            'email': 'verify@test.com',
+            'code': self.record.code
+        })
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.data['is_new'])
+        self.assertIn('access', response.data)
+
+        user = User.objects.get(email='verify@test.com')
+        self.assertTrue(user.check_password('Str0ng-pass-123'))
+        self.record.refresh_from_db()
+        self.assertTrue(self.record.is_used)
+
+
+    def test_split_endpoints_register_and_verify(self):
+        self.client.post('/api/auth/register/init/', {
+            'email': 'split@test.com',
+            'password': 'Str0ng-pass-123'
+        })
+        record = EmailVerification.objects.get(email='split@test.com')
+
+        response = self.client.post('/api/auth/register/verify/', {
+            'email': 'split@test.com',
+            'code': record.code
+        })
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.data['is_new'])
+        self.assertTrue(User.objects.filter(email='split@test.com').exists())
+
+
+class MeViewTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            email='me@test.com',
+            password='testpass123'
+        )
+        self.client.force_authenticate(user=self.user)
+
+    def test_me_matches_user_serializer(self):
+        response = self.client.get('/api/auth/me/')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json(), dict(UserSerializer(self.user).data))
+
+
+class SocialImportSourcesTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            email='social@test.com',
+            password='testpass123'
+        )
+        SocialAccount.objects.create(user=self.user, provider='google', uid='g-123')
+        self.client.force_authenticate(user=self.user)
+
+    def test_import_sources_in_one_query(self):
+        with self.assertNumQueries(1):
+            response = self.client.get('/api/auth/profile/import-sources/')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.data['google']['connected'])
+        self.assertFalse(response.data['facebook']['connected'])
+
+    def test_provider_cache_dropped_when_account_linked(self):
+        self.client.get('/api/auth/profile/basic/')
+        with self.assertNumQueries(0):
+            self.client.get('/api/auth/profile/basic/')
 
-# Create your tests here.
+        SocialAccount.objects.create(user=self.user, provider='facebook', uid='f-456')
+        response = self.client.get('/api/auth/profile/basic/')
+        self.assertTrue(response.data['has_facebook'])
@@ -2,6 +2,8 @@
 from django.urls import path
 from .views import (
     RegisterView,
+    RegisterInitView,
+    RegisterVerifyView,
     LoginView,
     RefreshTokenView,
     MeView,
@@ -12,7 +14,7 @@ from .views import (
     ResetPasswordView,
     ChangePasswordView,
     DeactivateAccountView,
-    BasicProfileView, 
+    BasicProfileView,
     SocialImportSourcesView,
 )
 
@@ -22,6 +24,8 @@ app_name = "accounts"
 urlpatterns = [
     # Registration (2-step)
     path("register/", RegisterView.as_view(), name="auth_register"),
+    path("register/init/", RegisterInitView.as_view(), name="auth_register_init"),
+    path("register/verify/", RegisterVerifyView.as_view(), name="auth_register_verify"),
 
     # login / tokens / profile / logout
     path("login/", LoginView.as_view(), name="auth_login"),
@@ -37,9 +41,11 @@ urlpatterns = [
     # account management
     path("deactivate/", DeactivateAccountView.as_view(), name="auth_deactivate"),
 
-    # social logins (placeholders)
+    # social logins
     path("google/", GoogleLoginView.as_view(), name="auth_google"),
     path("facebook/", FacebookLoginView.as_view(), name="auth_facebook"),
+
+    # profile data for the AI wizard
     path("profile/basic/", BasicProfileView.as_view(), name="profile_basic"),
     path("profile/import-sources/", SocialImportSourcesView.as_view(), name="import_sources"),
 ]
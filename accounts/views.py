@@ -1,5 +1,7 @@
 # accounts/views.py
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
 
 from rest_framework import permissions, status
 from rest_framework.generics import RetrieveAPIView
@@ -11,9 +13,12 @@ from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
 from rest_framework_simplejwt.tokens import RefreshToken
 
 from drf_spectacular.utils import extend_schema
+from allauth.socialaccount.models import SocialAccount
+
 from .social_serializers import GoogleAuthSerializer, FacebookAuthSerializer
 
 from .models import EmailVerification
+from .signals import PROVIDERS_CACHE_KEY
 from .serializers import (
     UserSerializer,
     CustomTokenObtainPairSerializer,
@@ -23,11 +28,45 @@ from .serializers import (
     ForgotPasswordSerializer,
     ResetPasswordSerializer,
     ChangePasswordSerializer,
+    serialize_user,
 )
 
 User = get_user_model()
-# Add to imports
-from allauth.socialaccount.models import SocialAccount
+
+# Provider links change rarely; the profile views can serve a short-lived copy
+PROVIDERS_CACHE_SECONDS = 60
+
+
+def _connected_providers(user):
+    """Providers linked to `user`, cached briefly and dropped on link/unlink."""
+    key = PROVIDERS_CACHE_KEY.format(user.pk)
+    providers = cache.get(key)
+    if providers is None:
+        providers = list(
+            SocialAccount.objects.filter(user=user)
+            .values_list('provider', flat=True)
+        )
+        cache.set(key, providers, timeout=PROVIDERS_CACHE_SECONDS)
+    return providers
+
+
+def _issue_tokens(user, is_new, extra_claims=None):
+    """
+    Response body shared by every login that ends in a fresh JWT pair:
+    email verification, Google and Facebook.
+    """
+    refresh = RefreshToken.for_user(user)
+    refresh["role"] = user.role
+    refresh["email"] = user.email
+    for claim, value in (extra_claims or {}).items():
+        refresh[claim] = value
+
+    return {
+        "refresh": str(refresh),
+        "access": str(refresh.access_token),
+        "user": serialize_user(user),
+        "is_new": is_new,
+    }
 
 
 @extend_schema(
@@ -46,16 +85,13 @@ class BasicProfileView(APIView):
         user = request.user
         
         # Get connected social providers
-        providers = list(
-            SocialAccount.objects.filter(user=user)
-            .values_list('provider', flat=True)
-        )
+        providers = _connected_providers(user)
         
-        # Build name from first/last name or email
-        name_parts = [user.first_name, user.last_name]
-        name = " ".join([p for p in name_parts if p]).strip()
-        if not name:
-            name = user.email.split('@')[0]  # Fallback to email username
+        # Build name from first/last name, falling back to the email username
+        name = (
+            f"{user.first_name or ''} {user.last_name or ''}".strip()
+            or user.email.split('@', 1)[0]
+        )
         
         return Response({
             "name": name,
@@ -82,17 +118,9 @@ class SocialImportSourcesView(APIView):
     def get(self, request):
         user = request.user
         
-        # Check Google
-        google_account = SocialAccount.objects.filter(
-            user=user, provider='google'
-        ).first()
-        google_connected = bool(google_account)
-        
-        # Check Facebook
-        facebook_account = SocialAccount.objects.filter(
-            user=user, provider='facebook'
-        ).first()
-        facebook_connected = bool(facebook_account)
+        providers = set(_connected_providers(user))
+        google_connected = 'google' in providers
+        facebook_connected = 'facebook' in providers
         
         return Response({
             "google": {
@@ -155,6 +183,9 @@ class MeView(RetrieveAPIView):
     def get_object(self):
         return self.request.user
 
+    def retrieve(self, request, *args, **kwargs):
+        return Response(serialize_user(self.get_object()))
+
 
 @extend_schema(
     tags=["Auth"],
@@ -191,6 +222,9 @@ class RegisterView(APIView):
     Unified endpoint for registration:
     - INIT (email + password) -> 201, code sent.
     - VERIFY (email + code) -> 200, tokens + user.
+
+    Kept for existing clients; new clients should use register/init/ and
+    register/verify/, which skip the RegisterRequestSerializer pass.
     """
     permission_classes = [permissions.AllowAny]
 
@@ -225,43 +259,64 @@ class RegisterView(APIView):
         record = verify_serializer.validated_data["record"]
         email = record.email
 
-        # Create user with hashed password from verification record
-        user, created = User.objects.get_or_create(
-            email=email,
-            defaults={
-                "role": record.role,
-                "password": record.password_hash or "",  # set below if present
-            },
-        )
+        with transaction.atomic():
+            # The code proves the email is unregistered, so go straight to
+            # one INSERT carrying the hashed password; a concurrent verify
+            # that won the race is picked up from the unique email.
+            try:
+                with transaction.atomic():
+                    user = User.objects.create(
+                        email=email,
+                        role=record.role,
+                        password=record.password_hash or "",
+                    )
+                created = True
+            except IntegrityError:
+                user = User.objects.get(email=email)
+                created = False
+
+            # Ensure user is not blocked or deactivated before issuing tokens
+            if not user.is_active:
+                raise AuthenticationFailed("User account is disabled.")
+            if user.is_blocked:
+                raise AuthenticationFailed(
+                    "Your account has been blocked. Please contact support."
+                )
+
+            record.mark_used()
+
+        return Response(_issue_tokens(user, created), status=status.HTTP_200_OK)
 
-        # If we created the user, set password from hash
-        if created and record.password_hash:
-            user.password = record.password_hash
-            user.save(update_fields=["password"])
 
-        # Ensure user is not blocked or deactivated before issuing tokens
-        if not user.is_active:
-            raise AuthenticationFailed("User account is disabled.")
-        if getattr(user, "is_blocked", False):
-            raise AuthenticationFailed(
-                "Your account has been blocked. Please contact support."
-            )
+@extend_schema(
+    request=EmailRegisterInitiateSerializer,
+    tags=["Auth"],
+    summary="Register step 1: send verification code",
+)
+class RegisterInitView(RegisterView):
+    """
+    POST /api/auth/register/init/
+    Body: { "email": "...", "password": "..." } -> 201, code sent.
+    Validated once by EmailRegisterInitiateSerializer (no wrapper pass).
+    """
 
-        record.mark_used()
+    def post(self, request, *args, **kwargs):
+        return self._handle_init(request.data)
 
-        refresh = RefreshToken.for_user(user)
-        refresh["role"] = user.role
-        refresh["email"] = user.email
 
-        return Response(
-            {
-                "refresh": str(refresh),
-                "access": str(refresh.access_token),
-                "user": UserSerializer(user).data,
-                "is_new": created,
-            },
-            status=status.HTTP_200_OK,
-        )
+@extend_schema(
+    request=EmailRegisterVerifySerializer,
+    tags=["Auth"],
+    summary="Register step 2: verify code and get tokens",
+)
+class RegisterVerifyView(RegisterView):
+    """
+    POST /api/auth/register/verify/
+    Body: { "email": "...", "code": "123456" } -> 200, tokens + user.
+    """
+
+    def post(self, request, *args, **kwargs):
+        return self._handle_verify(request.data)
 
 
 @extend_schema(
@@ -373,18 +428,8 @@ class GoogleLoginView(APIView):
         user = serializer.validated_data["user"]
         is_new = serializer.validated_data["is_new"]
 
-        refresh = RefreshToken.for_user(user)
-        refresh["role"] = user.role
-        refresh["email"] = user.email
-        refresh["auth_provider"] = user.auth_provider
-
         return Response(
-            {
-                "refresh": str(refresh),
-                "access": str(refresh.access_token),
-                "user": UserSerializer(user).data,
-                "is_new": is_new,
-            },
+            _issue_tokens(user, is_new, {"auth_provider": user.auth_provider}),
             status=status.HTTP_200_OK,
         )
 
@@ -405,17 +450,7 @@ class FacebookLoginView(APIView):
         user = serializer.validated_data["user"]
         is_new = serializer.validated_data["is_new"]
 
-        refresh = RefreshToken.for_user(user)
-        refresh["role"] = user.role
-        refresh["email"] = user.email
-        refresh["auth_provider"] = user.auth_provider
-
         return Response(
-            {
-                "refresh": str(refresh),
-                "access": str(refresh.access_token),
-                "user": UserSerializer(user).data,
-                "is_new": is_new,
-            },
+            _issue_tokens(user, is_new, {"auth_provider": user.auth_provider}),
             status=status.HTTP_200_OK,
         )
@@ -1,14 +1,16 @@
 # ai_core/admin.py
 import csv
-import json
 from datetime import timedelta
 
+import orjson
 from django.contrib import admin
 from django.contrib.admin import SimpleListFilter
-from django.http import HttpResponse
 from django.utils import timezone
 from django.utils.html import format_html
-from django.db.models import Sum
+from django.db.models import F, Sum
+
+from accounts.exports import EXPORT_CHUNK_SIZE, _Echo, export_response
+from accounts.paginators import ApproxCountPaginator
 
 from .models import AIUsageLog
 
@@ -28,34 +30,44 @@ class SuccessFilter(SimpleListFilter):
         return queryset
 
 
+# Resolved once instead of per changelist row
+FEATURE_DISPLAY = dict(AIUsageLog.FeatureType.choices)
+
+
 def export_as_csv(modeladmin, request, queryset):
-    response = HttpResponse(content_type="text/csv")
-    response["Content-Disposition"] = 'attachment; filename="ai_usage_logs.csv"'
-    writer = csv.writer(response)
-    writer.writerow(["user", "feature_type", "model_name", "tokens_in", "tokens_out", "cost_estimate", "success", "created_at"])
-    for log in queryset.select_related("user"):
-        writer.writerow([log.user.email, log.feature_type, log.model_name, log.tokens_in, log.tokens_out, log.cost_estimate, log.success, log.created_at])
-    return response
+    writer = csv.writer(_Echo())
+
+    def rows():
+        yield writer.writerow(["user", "feature_type", "model_name", "tokens_in", "tokens_out", "cost_estimate", "success", "created_at"])
+        values = queryset.values_list("user__email", "feature_type", "model_name", "tokens_in", "tokens_out", "cost_estimate", "success", "created_at")
+        for row in values.iterator(chunk_size=EXPORT_CHUNK_SIZE):
+            yield writer.writerow(row)
+
+    return export_response(request, rows(), "text/csv", "ai_usage_logs.csv")
 
 
 def export_as_json(modeladmin, request, queryset):
-    data = []
-    for log in queryset.select_related("user"):
-        data.append({
-            "id": str(log.id),
-            "user": log.user.email,
-            "feature_type": log.feature_type,
-            "model_name": log.model_name,
-            "tokens_in": log.tokens_in,
-            "tokens_out": log.tokens_out,
-            "cost_estimate": str(log.cost_estimate),
-            "success": log.success,
-            "error_message": log.error_message,
-            "created_at": log.created_at.isoformat(),
-        })
-    response = HttpResponse(json.dumps(data, indent=2), content_type="application/json")
-    response["Content-Disposition"] = 'attachment; filename="ai_usage_logs.json"'
-    return response
+    def rows():
+        yield b"["
+        separator = b"\n"
+        values = queryset.values("id", "user__email", "feature_type", "model_name", "tokens_in", "tokens_out", "cost_estimate", "success", "error_message", "created_at")
+        for log in values.iterator(chunk_size=EXPORT_CHUNK_SIZE):
+            yield separator + orjson.dumps({
+                "id": str(log["id"]),
+                "user": log["user__email"],
+                "feature_type": log["feature_type"],
+                "model_name": log["model_name"],
+                "tokens_in": log["tokens_in"],
+                "tokens_out": log["tokens_out"],
+                "cost_estimate": str(log["cost_estimate"]),
+                "success": log["success"],
+                "error_message": log["error_message"],
+                "created_at": log["created_at"].isoformat(),
+            }, option=orjson.OPT_INDENT_2)
+            separator = b",\n"
+        yield b"\n]"
+
+    return export_response(request, rows(), "application/json", "ai_usage_logs.json")
 
 
 export_as_csv.short_description = "Export selected as CSV"
@@ -69,14 +81,18 @@ class AIUsageLogAdmin(admin.ModelAdmin):
     search_fields = ("user__email", "feature_type", "model_name", "error_message")
     readonly_fields = ("created_at", "tokens_total", "error_preview")
     ordering = ("-created_at",)
+    paginator = ApproxCountPaginator
+    show_full_result_count = False
     actions = [export_as_csv, export_as_json, "show_month_cost"]
 
     def get_queryset(self, request):
-        return super().get_queryset(request).select_related("user")
+        # Only the email is shown; annotate it instead of joining whole User rows
+        return super().get_queryset(request).annotate(_user_email=F("user__email"))
 
     def user_email(self, obj):
-        return obj.user.email
+        return obj._user_email
     user_email.short_description = "User"
+    user_email.admin_order_field = "_user_email"
 
     def tokens_total(self, obj):
         return (obj.tokens_in or 0) + (obj.tokens_out or 0)
@@ -87,7 +103,7 @@ class AIUsageLogAdmin(admin.ModelAdmin):
     success_badge.short_description = "OK?"
 
     def feature_badge(self, obj):
-        return format_html("<span style='padding:2px 8px;border-radius:10px;background:#0ea5e9;color:#fff;font-size:12px'>{}</span>", obj.get_feature_type_display())
+        return format_html("<span style='padding:2px 8px;border-radius:10px;background:#0ea5e9;color:#fff;font-size:12px'>{}</span>", FEATURE_DISPLAY.get(obj.feature_type, obj.feature_type))
     feature_badge.short_description = "Feature"
 
     def error_preview(self, obj):
@@ -98,7 +114,10 @@ class AIUsageLogAdmin(admin.ModelAdmin):
 
     @admin.action(description="Show total cost for current month (selected or all)")
     def show_month_cost(self, request, queryset):
-        now = timezone.now()
+        now = timezone.localtime()
+        # Half-open month range so the created_at index is used (no EXTRACT)
+        start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+        end = (start + timedelta(days=32)).replace(day=1)
         base = queryset if queryset.exists() else AIUsageLog.objects.all()
-        total = base.filter(created_at__year=now.year, created_at__month=now.month).aggregate(s=Sum("cost_estimate"))["s"] or 0
+        total = base.filter(created_at__gte=start, created_at__lt=end).aggregate(s=Sum("cost_estimate"))["s"] or 0
         self.message_user(request, f"Total AI cost for {now.strftime('%B %Y')}: {total}")
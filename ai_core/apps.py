@@ -4,3 +4,13 @@ from django.apps import AppConfig
 class AiCoreConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'ai_core'
+
+    def ready(self):
+        from django.core.signals import request_finished
+        from .services import AILogService
+
+        # FlushAIUsageMiddleware writes each request's rows; this only catches
+        # rows queued after it ran
+        request_finished.connect(
+            AILogService.flush_after_request, dispatch_uid="ai_core.flush_usage"
+        )
@@ -0,0 +1,19 @@
+from .services import AILogService
+
+
+class FlushAIUsageMiddleware:
+    """
+    Write the AIUsageLog rows queued during a request once its response is
+    built, while the request still owns its DB connection. Flushing from
+    request_finished instead would run after Django's close_old_connections
+    and reopen a connection that then sits idle on the worker thread.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        try:
+            return self.get_response(request)
+        finally:
+            AILogService.flush_usage()
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.8 on 2026-10-16 13:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ai_core', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='aiusagelog',
+            index=models.Index(fields=['user', '-created_at'], name='ailog_user_created_idx'),
+        ),
+    ]
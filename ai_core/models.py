@@ -43,6 +43,8 @@ class AIUsageLog(models.Model):
         indexes = [
             models.Index(fields=['created_at']),
             models.Index(fields=['user', 'feature_type']),
+            # Latest logs per user without a sort step
+            models.Index(fields=['user', '-created_at'], name='ailog_user_created_idx'),
         ]
         ordering = ['-created_at']
 
@@ -1,11 +1,30 @@
+import hashlib
 import logging
+import threading
+
+from django.db import close_old_connections
+
 from .models import AIUsageLog
 
 logger = logging.getLogger(__name__)
 
+# Usage rows queued during the current request, written in one INSERT once
+# the response is built (see FlushAIUsageMiddleware)
+_pending = threading.local()
+QUEUE_FLUSH_SIZE = 100
+
+# Approximate USD per 1K (input, output) tokens, matched by model-name prefix.
+# First match wins, so keep longer prefixes above the ones they extend.
+_PRICING_PER_1K = {
+    "gpt-4o": (0.005, 0.015),
+    "gpt-4": (0.03, 0.06),
+    "gpt-3.5": (0.0005, 0.0015),
+}
+
+
 class AILogService:
     @staticmethod
-    def log_usage(
+    def build_log(
         user,
         feature_type,
         model_name,
@@ -16,31 +35,84 @@ class AILogService:
         success=True,
         error_message=""
     ):
+        """Unsaved AIUsageLog with the prompt hash and cost filled in."""
+        p_hash = prompt_hash
+        if not p_hash and prompt:
+            # Stable across processes, unlike the per-process salted hash()
+            p_hash = hashlib.blake2b(str(prompt).encode("utf-8"), digest_size=16).hexdigest()
+
+        # Simple cost estimation (approximate, see _PRICING_PER_1K).
+        # Failure logs carry no tokens, so there is nothing to price.
+        cost = 0.0
+        if tokens_in or tokens_out:
+            for prefix, (in_price, out_price) in _PRICING_PER_1K.items():
+                if model_name.startswith(prefix):
+                    cost = (tokens_in * in_price + tokens_out * out_price) / 1000
+                    break
+
+        return AIUsageLog(
+            user=user,
+            feature_type=feature_type,
+            model_name=model_name,
+            prompt_hash=p_hash or "",
+            tokens_in=tokens_in,
+            tokens_out=tokens_out,
+            cost_estimate=cost,
+            success=success,
+            error_message=error_message[:1000] if error_message else ""
+        )
+
+    @staticmethod
+    def log_usage(*args, **kwargs):
+        """Write one usage row now and return it (None if logging failed)."""
         try:
-            p_hash = prompt_hash
-            if not p_hash and prompt:
-                p_hash = str(hash(str(prompt)))
-            
-            # Simple cost estimation (approximate for GPT-4/3.5)
-            # This is a placeholder logic; real logic would depend on model pricing
-            cost = 0.0
-            if model_name.startswith("gpt-4"):
-                cost = (tokens_in * 0.03 + tokens_out * 0.06) / 1000
-            elif model_name.startswith("gpt-3.5"):
-                cost = (tokens_in * 0.0005 + tokens_out * 0.0015) / 1000
-            
-            log = AIUsageLog.objects.create(
-                user=user,
-                feature_type=feature_type,
-                model_name=model_name,
-                prompt_hash=p_hash or "",
-                tokens_in=tokens_in,
-                tokens_out=tokens_out,
-                cost_estimate=cost,
-                success=success,
-                error_message=error_message[:1000] if error_message else ""
-            )
+            log = AILogService.build_log(*args, **kwargs)
+            log.save()
             return log
         except Exception as e:
-            logger.error(f"Failed to log AI usage: {e}")
+            logger.error("Failed to log AI usage: %s", e)
             return None
+
+    @staticmethod
+    def queue_usage(*args, **kwargs):
+        """
+        Same arguments as log_usage, but the row is buffered and written with
+        the rest of the request's rows by flush_usage().
+        """
+        try:
+            log = AILogService.build_log(*args, **kwargs)
+        except Exception as e:
+            logger.error("Failed to log AI usage: %s", e)
+            return
+
+        buffer = getattr(_pending, "logs", None)
+        if buffer is None:
+            buffer = _pending.logs = []
+        buffer.append(log)
+
+        # Callers outside a request never see request_finished; cap the buffer
+        if len(buffer) >= QUEUE_FLUSH_SIZE:
+            AILogService.flush_usage()
+
+    @staticmethod
+    def flush_usage():
+        """Bulk-insert this thread's queued rows; returns whether any were pending."""
+        buffer = getattr(_pending, "logs", None)
+        if not buffer:
+            return False
+        _pending.logs = []
+        try:
+            AIUsageLog.objects.bulk_create(buffer, batch_size=QUEUE_FLUSH_SIZE)
+        except Exception as e:
+            logger.error("Failed to log AI usage: %s", e)
+        return True
+
+    @staticmethod
+    def flush_after_request(**kwargs):
+        """
+        request_finished backstop for rows queued after the middleware ran
+        (e.g. while a streaming response was iterated). Django has already
+        cleaned up connections by now, so release the one the INSERT reopened.
+        """
+        if AILogService.flush_usage():
+            close_old_connections()
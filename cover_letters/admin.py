@@ -1,16 +1,19 @@
 # cover_letters/admin.py
 import csv
-import json
 from datetime import timedelta
 
+import orjson
 from django.contrib import admin
 from django.contrib.admin import SimpleListFilter
-from django.http import HttpResponse
 from django.utils import timezone
 from django.utils.html import format_html
-from django.db.models import Count
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+from accounts.exports import EXPORT_CHUNK_SIZE, _Echo, export_response
 
 from .models import CoverLetter, CoverLetterTemplate
+from .signals import invalidate_template_list
 
 
 class DeletedFilter(SimpleListFilter):
@@ -28,30 +31,52 @@ class DeletedFilter(SimpleListFilter):
         return queryset
 
 
+# Resolved once instead of per changelist row
+STATUS_DISPLAY = dict(CoverLetter._meta.get_field("status").flatchoices)
+STATUS_COLORS = {"draft": "#6b7280", "published": "#16a34a"}
+
+
+def _badge(color, label):
+    return format_html(
+        "<span style='padding:2px 8px;border-radius:10px;background:{};color:#fff;font-size:12px'>{}</span>",
+        color, label
+    )
+
+
+STATUS_BADGES = {value: _badge(STATUS_COLORS.get(value, "#3b82f6"), label) for value, label in STATUS_DISPLAY.items()}
+DELETED_BADGE = _badge("#dc2626", "Deleted")
+
+
 def export_as_csv(modeladmin, request, queryset):
     model = modeladmin.model
     meta = model._meta
     field_names = [f.name for f in meta.fields]
+    relations = [f.name for f in meta.fields if f.is_relation]
+    writer = csv.writer(_Echo())
+
+    def rows():
+        yield writer.writerow(field_names)
+        for obj in queryset.select_related(*relations).iterator(chunk_size=EXPORT_CHUNK_SIZE):
+            yield writer.writerow([getattr(obj, f) for f in field_names])
 
-    response = HttpResponse(content_type="text/csv")
-    response["Content-Disposition"] = f'attachment; filename="{meta.model_name}.csv"'
-    writer = csv.writer(response)
-    writer.writerow(field_names)
-    for obj in queryset:
-        writer.writerow([getattr(obj, f) for f in field_names])
-    return response
+    return export_response(request, rows(), "text/csv", f"{meta.model_name}.csv")
 
 
 def export_as_json(modeladmin, request, queryset):
-    data = []
-    for obj in queryset:
-        row = {}
-        for f in obj._meta.fields:
-            row[f.name] = str(getattr(obj, f.name))
-        data.append(row)
-    response = HttpResponse(json.dumps(data, indent=2, default=str), content_type="application/json")
-    response["Content-Disposition"] = f'attachment; filename="{modeladmin.model._meta.model_name}.json"'
-    return response
+    fields = modeladmin.model._meta.fields
+    field_names = [f.name for f in fields]
+    relations = [f.name for f in fields if f.is_relation]
+
+    def rows():
+        yield b"["
+        separator = b"\n"
+        for obj in queryset.select_related(*relations).iterator(chunk_size=EXPORT_CHUNK_SIZE):
+            row = {f: str(getattr(obj, f)) for f in field_names}
+            yield separator + orjson.dumps(row, default=str, option=orjson.OPT_INDENT_2)
+            separator = b",\n"
+        yield b"\n]"
+
+    return export_response(request, rows(), "application/json", f"{modeladmin.model._meta.model_name}.json")
 
 
 export_as_csv.short_description = "Export selected as CSV"
@@ -69,7 +94,11 @@ class CoverLetterTemplateAdmin(admin.ModelAdmin):
 
     def get_queryset(self, request):
         qs = super().get_queryset(request)
-        return qs.annotate(_cl_count=Count("coverletter"))
+        # Per-row subquery keeps GROUP BY out of the changelist COUNT
+        letters = CoverLetter.objects.filter(template=OuterRef("pk")).order_by().values("template")
+        return qs.annotate(
+            _cl_count=Coalesce(Subquery(letters.annotate(c=Count("*")).values("c")), 0)
+        )
 
     def usage_count(self, obj):
         return getattr(obj, "_cl_count", 0)
@@ -78,7 +107,7 @@ class CoverLetterTemplateAdmin(admin.ModelAdmin):
 
     def definition_preview(self, obj):
         try:
-            return format_html("<pre style='max-height:300px;overflow:auto'>{}</pre>", json.dumps(obj.definition or {}, indent=2))
+            return format_html("<pre style='max-height:300px;overflow:auto'>{}</pre>", orjson.dumps(obj.definition or {}, option=orjson.OPT_INDENT_2).decode())
         except Exception:
             return "Invalid JSON"
     definition_preview.short_description = "Definition (readable)"
@@ -86,18 +115,22 @@ class CoverLetterTemplateAdmin(admin.ModelAdmin):
     @admin.action(description="Activate selected templates")
     def activate_templates(self, request, queryset):
         queryset.update(is_active=True)
+        invalidate_template_list()
 
     @admin.action(description="Deactivate selected templates")
     def deactivate_templates(self, request, queryset):
         queryset.update(is_active=False)
+        invalidate_template_list()
 
     @admin.action(description="Mark selected templates as PREMIUM")
     def mark_premium(self, request, queryset):
         queryset.update(is_premium=True)
+        invalidate_template_list()
 
     @admin.action(description="Mark selected templates as FREE")
     def mark_free(self, request, queryset):
         queryset.update(is_premium=False)
+        invalidate_template_list()
 
 
 @admin.register(CoverLetter)
@@ -106,6 +139,8 @@ class CoverLetterAdmin(admin.ModelAdmin):
     list_filter = (DeletedFilter, "status", "template", "created_at")
     search_fields = ("title", "user__email", "company_name", "job_title")
     ordering = ("-updated_at",)
+    # Skip the extra unfiltered COUNT(*) on filtered/searched changelists
+    show_full_result_count = False
     readonly_fields = ("id", "created_at", "updated_at", "deleted_at", "body_preview")
     fieldsets = (
         ("Basic Info", {"fields": ("user", "linked_resume", "title")}),
@@ -124,14 +159,12 @@ class CoverLetterAdmin(admin.ModelAdmin):
     user_email.short_description = "User"
 
     def status_badge(self, obj):
-        color = {"draft": "#6b7280", "published": "#16a34a"}.get(obj.status, "#3b82f6")
-        return format_html("<span style='padding:2px 8px;border-radius:10px;background:{};color:#fff;font-size:12px'>{}</span>", color, obj.get_status_display())
+        badge = STATUS_BADGES.get(obj.status)
+        return badge if badge is not None else _badge("#3b82f6", obj.status)
     status_badge.short_description = "Status"
 
     def deleted_badge(self, obj):
-        if obj.deleted_at:
-            return format_html("<span style='padding:2px 8px;border-radius:10px;background:#dc2626;color:#fff;font-size:12px'>Deleted</span>")
-        return ""
+        return DELETED_BADGE if obj.deleted_at else ""
     deleted_badge.short_description = "Deleted"
 
     def body_preview(self, obj):
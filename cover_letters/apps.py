@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class CoverLettersConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'cover_letters'
+
+    def ready(self):
+        # Import signals
+        import cover_letters.signals  # noqa: F401
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.8 on 2026-10-16 13:40
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cover_letters', '0003_seed_default_template'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='coverletter',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True)), fields=['user', '-updated_at'], name='cl_active_idx'),
+        ),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 5.2.8 on 2026-10-16 15:05
+
+from django.db import migrations
+
+INDEX_NAME = 'cl_created_brin'
+
+
+def create_created_at_index(apps, schema_editor):
+    """
+    BRIN on Postgres (rows arrive in created_at order, so block ranges stay
+    tight and the index is tiny); a plain btree everywhere else.
+    """
+    CoverLetter = apps.get_model('cover_letters', 'CoverLetter')
+    qn = schema_editor.quote_name
+    table = qn(CoverLetter._meta.db_table)
+    column = qn(CoverLetter._meta.get_field('created_at').column)
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute(
+            f"CREATE INDEX {qn(INDEX_NAME)} ON {table} USING BRIN ({column}) "
+            f"WITH (pages_per_range = 32)"
+        )
+    else:
+        schema_editor.execute(f"CREATE INDEX {qn(INDEX_NAME)} ON {table} ({column})")
+
+
+def drop_created_at_index(apps, schema_editor):
+    schema_editor.execute(f"DROP INDEX {schema_editor.quote_name(INDEX_NAME)}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cover_letters', '0004_coverletter_cl_active_idx'),
+    ]
+
+    # Vendor-specific, so it lives here rather than in CoverLetter.Meta.indexes
+    operations = [
+        migrations.RunPython(create_created_at_index, reverse_code=drop_created_at_index),
+    ]
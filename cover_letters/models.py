@@ -1,5 +1,5 @@
 import uuid
-from django.db import models
+from django.db import connection, models
 from django.conf import settings
 from django.utils import timezone
 
@@ -47,6 +47,14 @@ class CoverLetter(models.Model):
 
     class Meta:
         ordering = ['-updated_at']
+        indexes = [
+            # The owner's list: live letters only, newest first
+            models.Index(
+                fields=['user', '-updated_at'],
+                condition=models.Q(deleted_at__isnull=True),
+                name='cl_active_idx',
+            ),
+        ]
 
     def __str__(self):
         return f"{self.title} - {self.user.email}"
@@ -55,6 +63,49 @@ class CoverLetter(models.Model):
         self.deleted_at = timezone.now()
         self.save(update_fields=['deleted_at'])
 
+    @classmethod
+    def duplicate_in_db(cls, pk, user):
+        """
+        Copy a live cover letter owned by `user` with one INSERT ... SELECT,
+        so body/job_description never pass through Python.
+        Returns the new id, or None if no such letter exists.
+        """
+        meta = cls._meta
+        qn = connection.ops.quote_name
+
+        def col(name):
+            return qn(meta.get_field(name).column)
+
+        copied = ", ".join(col(name) for name in (
+            'user', 'linked_resume', 'template', 'company_name',
+            'job_title', 'job_description', 'body', 'status',
+        ))
+
+        new_id = uuid.uuid4()
+        now = timezone.now()
+        pk_field = meta.pk
+        created_field = meta.get_field('created_at')
+        sql = (
+            f"INSERT INTO {qn(meta.db_table)} "
+            f"({col('id')}, {col('title')}, {col('created_at')}, {col('updated_at')}, {copied}) "
+            f"SELECT %s, {col('title')} || %s, %s, %s, {copied} "
+            f"FROM {qn(meta.db_table)} "
+            f"WHERE {col('id')} = %s AND {col('user')} = %s AND {col('deleted_at')} IS NULL"
+        )
+        params = [
+            pk_field.get_db_prep_value(new_id, connection),
+            " (Copy)",
+            created_field.get_db_prep_value(now, connection),
+            created_field.get_db_prep_value(now, connection),
+            pk_field.get_db_prep_value(pk, connection),
+            user.pk,
+        ]
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            if cursor.rowcount != 1:
+                return None
+        return new_id
+
 
 class CoverLetterTemplate(models.Model):
     """Template for cover letter styling and layout."""
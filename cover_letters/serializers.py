@@ -10,6 +10,21 @@ class CoverLetterTemplateSerializer(serializers.ModelSerializer):
         ]
 
 
+class TemplateDetailSerializer(CoverLetterTemplateSerializer):
+    """
+    Nested template for list rows. A list holds many letters but only a
+    handful of templates, so each template is rendered once per response.
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._rendered = {}
+
+    def to_representation(self, instance):
+        if instance.pk not in self._rendered:
+            self._rendered[instance.pk] = super().to_representation(instance)
+        return self._rendered[instance.pk]
+
+
 class CoverLetterSerializer(serializers.ModelSerializer):
     template_detail = CoverLetterTemplateSerializer(source='template', read_only=True)
     template_id = serializers.PrimaryKeyRelatedField(
@@ -32,6 +47,19 @@ class CoverLetterSerializer(serializers.ModelSerializer):
         validated_data['user'] = self.context['request'].user
         return super().create(validated_data)
 
+
+class CoverLetterListSerializer(serializers.ModelSerializer):
+    """Serializer for listing cover letters (compact, no body/job description)"""
+    template_detail = TemplateDetailSerializer(source='template', read_only=True)
+
+    class Meta:
+        model = CoverLetter
+        fields = [
+            'id', 'user', 'linked_resume', 'template', 'template_detail',
+            'title', 'company_name', 'job_title', 'status',
+            'created_at', 'updated_at'
+        ]
+
 class CoverLetterGenerateSerializer(serializers.Serializer):
     """Serializer for AI Generation of CL"""
     resume_id = serializers.UUIDField(required=True)
@@ -39,3 +67,8 @@ class CoverLetterGenerateSerializer(serializers.Serializer):
     job_title = serializers.CharField(max_length=200)
     job_description = serializers.CharField(required=False, allow_blank=True)
     tone = serializers.CharField(default='professional')
+
+
+class CoverLetterBulkShareSerializer(serializers.Serializer):
+    """Cover letter IDs to share in one request"""
+    ids = serializers.ListField(child=serializers.UUIDField(), allow_empty=False, max_length=100)
@@ -0,0 +1,35 @@
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import CoverLetter, CoverLetterTemplate
+
+# Serialized template list, one copy for staff (all) and one for everyone else
+TEMPLATE_LIST_CACHE_KEYS = {
+    True: "cl:templates:staff",
+    False: "cl:templates:active",
+}
+
+# Public (share link) payload of one letter, keyed by its id
+PUBLIC_LETTER_CACHE_KEY = "cl:public:{}"
+
+
+def invalidate_template_list():
+    cache.delete_many(list(TEMPLATE_LIST_CACHE_KEYS.values()))
+
+
+@receiver(post_save, sender=CoverLetterTemplate)
+@receiver(post_delete, sender=CoverLetterTemplate)
+def invalidate_template_list_on_change(sender, instance, **kwargs):
+    """
+    Drop the cached template lists whenever a template is saved or deleted.
+    Bulk queryset.update() sends no signal; callers invalidate explicitly.
+    """
+    invalidate_template_list()
+
+
+@receiver(post_save, sender=CoverLetter)
+@receiver(post_delete, sender=CoverLetter)
+def invalidate_public_letter_on_change(sender, instance, **kwargs):
+    """Queryset.update() soft deletes drop the key themselves."""
+    cache.delete(PUBLIC_LETTER_CACHE_KEY.format(instance.pk))
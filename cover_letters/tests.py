@@ -1,25 +1,36 @@
+from unittest import mock
+
+from django.contrib.admin.sites import site
+from django.core.cache import cache
+from django.core.signals import request_finished
 from django.test import TestCase
 from django.contrib.auth import get_user_model
 from rest_framework.test import APIClient
 from rest_framework import status
-from cover_letters.models import CoverLetter
+from cover_letters.admin import export_as_csv
+from cover_letters.models import CoverLetter, CoverLetterTemplate
+from cover_letters.serializers import CoverLetterTemplateSerializer
 from resumes.models import Resume, Template, ShareLink
 from ai_core.models import AIUsageLog
+from ai_core import services as ai_services
 
 User = get_user_model()
 
 
 class CoverLetterCRUDTests(TestCase):
-    def setUp(self):
-        self.client = APIClient()
-        self.user1 = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user1 = User.objects.create_user(
             email='user1@test.com',
             password='testpass123'
         )
-        self.user2 = User.objects.create_user(
+        cls.user2 = User.objects.create_user(
             email='user2@test.com',
             password='testpass123'
         )
+
+    def setUp(self):
+        self.client = APIClient()
         self.client.force_authenticate(user=self.user1)
         
     def test_create_cover_letter(self):
@@ -34,18 +45,43 @@ class CoverLetterCRUDTests(TestCase):
         self.assertEqual(CoverLetter.objects.count(), 1)
         
     def test_list_cover_letters_owner_only(self):
-        CoverLetter.objects.create(
-            user=self.user1,
-            title='CL 1'
-        )
-        CoverLetter.objects.create(
-            user=self.user2,
-            title='CL 2'
-        )
+        CoverLetter.objects.bulk_create([
+            CoverLetter(user=self.user1, title='CL 1'),
+            CoverLetter(user=self.user2, title='CL 2'),
+        ])
         response = self.client.get('/api/cover-letters/')
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(len(response.data), 1)
         
+    def test_list_joins_templates(self):
+        for i in range(3):
+            template = CoverLetterTemplate.objects.create(id=f'tpl-{i}', name=f'Template {i}', slug=f'tpl-{i}')
+            CoverLetter.objects.create(user=self.user1, title=f'CL {i}', template=template)
+
+        with self.assertNumQueries(1):
+            response = self.client.get('/api/cover-letters/')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), 3)
+        self.assertEqual(response.data[0]['template_detail']['name'][:8], 'Template')
+        self.assertNotIn('body', response.data[0])
+
+    def test_list_renders_shared_template_once(self):
+        template = CoverLetterTemplate.objects.create(id='tpl-shared', name='Shared', slug='tpl-shared')
+        for i in range(3):
+            CoverLetter.objects.create(user=self.user1, title=f'CL {i}', template=template)
+        expected = CoverLetterTemplateSerializer(template).data
+
+        with mock.patch.object(
+            CoverLetterTemplateSerializer, 'to_representation',
+            autospec=True, side_effect=CoverLetterTemplateSerializer.to_representation
+        ) as render:
+            response = self.client.get('/api/cover-letters/')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(render.call_count, 1)
+        self.assertEqual(len(response.data), 3)
+        for row in response.data:
+            self.assertEqual(row['template_detail'], expected)
+
     def test_other_user_cannot_access(self):
         cl = CoverLetter.objects.create(
             user=self.user2,
@@ -54,6 +90,21 @@ class CoverLetterCRUDTests(TestCase):
         response = self.client.get(f'/api/cover-letters/{cl.id}/')
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
         
+    def test_unchanged_letter_returns_not_modified(self):
+        cl = CoverLetter.objects.create(user=self.user1, title='Cached', body='Body')
+        response = self.client.get(f'/api/cover-letters/{cl.id}/')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        etag = response['ETag']
+
+        with self.assertNumQueries(1):
+            response = self.client.get(f'/api/cover-letters/{cl.id}/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        cl.title = 'Edited'
+        cl.save()
+        response = self.client.get(f'/api/cover-letters/{cl.id}/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
     def test_duplicate_cover_letter(self):
         cl = CoverLetter.objects.create(
             user=self.user1,
@@ -63,24 +114,69 @@ class CoverLetterCRUDTests(TestCase):
         response = self.client.post(f'/api/cover-letters/{cl.id}/duplicate/')
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         self.assertEqual(CoverLetter.objects.count(), 2)
+        copy = CoverLetter.objects.get(id=response.data['id'])
+        self.assertEqual(copy.title, 'Original (Copy)')
+        self.assertEqual(copy.body, 'Test body')
+        self.assertEqual(copy.user, self.user1)
+
+    def test_delete_is_soft_and_single_query(self):
+        cl = CoverLetter.objects.create(user=self.user1, title='Bye')
+        with self.assertNumQueries(1):
+            response = self.client.delete(f'/api/cover-letters/{cl.id}/')
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        cl.refresh_from_db()
+        self.assertIsNotNone(cl.deleted_at)
+
+        response = self.client.delete(f'/api/cover-letters/{cl.id}/')
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_duplicate_other_users_letter_not_found(self):
+        cl = CoverLetter.objects.create(user=self.user2, title='Not mine')
+        response = self.client.post(f'/api/cover-letters/{cl.id}/duplicate/')
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(CoverLetter.objects.count(), 1)
         
 
+    def test_bulk_share_reuses_existing_links(self):
+        cl1 = CoverLetter.objects.create(user=self.user1, title='CL 1')
+        cl2 = CoverLetter.objects.create(user=self.user1, title='CL 2')
+        first = self.client.post(f'/api/cover-letters/{cl1.id}/share/')
+
+        response = self.client.post('/api/cover-letters/bulk-share/', {
+            'ids': [str(cl1.id), str(cl2.id)]
+        }, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data[str(cl1.id)]['token'], first.data['token'])
+        self.assertIn(str(cl2.id), response.data)
+
+    def test_bulk_share_rejects_foreign_letters(self):
+        other = CoverLetter.objects.create(user=self.user2, title='Not mine')
+        response = self.client.post('/api/cover-letters/bulk-share/', {
+            'ids': [str(other.id)]
+        }, format='json')
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertFalse(ShareLink.objects.filter(resource_id=other.id).exists())
+
+
 class ShareLinkTests(TestCase):
-    def setUp(self):
-        self.client = APIClient()
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
             email='user@test.com',
             password='testpass123'
         )
-        self.template = Template.objects.create(
+        cls.template = Template.objects.create(
             id='test-template',
             name='Test Template'
         )
-        self.resume = Resume.objects.create(
-            user=self.user,
+        cls.resume = Resume.objects.create(
+            user=cls.user,
             title='Test Resume',
-            template=self.template
+            template=cls.template
         )
+
+    def setUp(self):
+        self.client = APIClient()
         self.client.force_authenticate(user=self.user)
         
     def test_create_share_link(self):
@@ -138,10 +234,47 @@ class AdminAPITests(TestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertGreaterEqual(len(response.data), 2)
         
+    def test_admin_user_detail_counts_are_independent(self):
+        template = Template.objects.create(id='count-tpl', name='Count Template')
+        for i in range(2):
+            Resume.objects.create(user=self.regular_user, title=f'Resume {i}', template=template)
+        for i in range(3):
+            CoverLetter.objects.create(user=self.regular_user, title=f'CL {i}')
+        CoverLetter.objects.create(user=self.regular_user, title='Gone').soft_delete()
+
+        self.client.force_authenticate(user=self.admin_user)
+        response = self.client.get(f'/api/admin/users/{self.regular_user.id}/')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['resume_count'], 2)
+        self.assertEqual(response.data['cover_letter_count'], 3)
+
     def test_admin_can_view_ai_logs(self):
         self.client.force_authenticate(user=self.admin_user)
-        response = self.client.get('/api/admin/ai-logs/')
+        AIUsageLog.objects.bulk_create(
+            AIUsageLog(
+                user=self.regular_user,
+                feature_type=AIUsageLog.FeatureType.SUMMARY,
+                model_name='gpt-4',
+                tokens_in=i % 7,
+            )
+            for i in range(105)
+        )
+        # Orderings outside ordering_fields are ignored; the cursor stays on created_at
+        response = self.client.get('/api/admin/ai-logs/?ordering=tokens_in')
         self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn('results', response.data)
+        self.assertIsNotNone(response.data['next'])
+
+        seen = [row['id'] for row in response.data['results']]
+        next_url = response.data['next']
+        while next_url:
+            response = self.client.get(next_url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            seen.extend(row['id'] for row in response.data['results'])
+            next_url = response.data['next']
+
+        self.assertEqual(len(seen), 105)
+        self.assertEqual(len(set(seen)), 105)
 
 
 class AILoggingTests(TestCase):
@@ -168,3 +301,92 @@ class AILoggingTests(TestCase):
         self.assertEqual(log.user, self.user)
         self.assertEqual(log.feature_type, AIUsageLog.FeatureType.SUMMARY)
         self.assertTrue(log.success)
+
+    def test_queued_ai_logs_written_on_flush(self):
+        from ai_core.services import AILogService
+
+        for feature in (AIUsageLog.FeatureType.SUMMARY, AIUsageLog.FeatureType.BULLETS):
+            AILogService.queue_usage(
+                user=self.user,
+                feature_type=feature,
+                model_name='gpt-4',
+                prompt='test prompt',
+            )
+        self.assertEqual(AIUsageLog.objects.count(), 0)
+
+        with self.assertNumQueries(1):
+            AILogService.flush_usage()
+        self.assertEqual(AIUsageLog.objects.filter(user=self.user).count(), 2)
+
+    def test_queued_ai_logs_written_before_request_finished(self):
+        def fake_bullets(user, **kwargs):
+            ai_services.AILogService.queue_usage(
+                user=user,
+                feature_type=AIUsageLog.FeatureType.BULLETS,
+                model_name='gpt-4',
+                prompt='test prompt',
+            )
+            return ['bullet']
+
+        service = mock.Mock(model='gpt-4', generate_bullets=fake_bullets)
+        pending_at_finish = []
+
+        def record_pending(**kwargs):
+            pending_at_finish.append(len(getattr(ai_services._pending, 'logs', None) or []))
+
+        # By request_finished Django has already run close_old_connections;
+        # nothing may still be waiting to reopen a connection at that point
+        request_finished.connect(record_pending)
+        self.addCleanup(request_finished.disconnect, record_pending)
+
+        client = APIClient()
+        client.force_authenticate(user=self.user)
+        with mock.patch('resumes.api.views_ai.AIResumeService', return_value=service):
+            response = client.post('/api/ai/bullets/', {
+                'role': 'Developer', 'company': 'Test Corp', 'description': 'Built things'
+            }, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(pending_at_finish, [0])
+        self.assertEqual(AIUsageLog.objects.filter(user=self.user).count(), 1)
+
+
+class AdminExportTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email='export@test.com',
+            password='testpass123'
+        )
+        for i in range(3):
+            CoverLetter.objects.create(user=self.user, title=f'CL {i}')
+
+    def test_csv_export_does_not_query_per_row(self):
+        modeladmin = site._registry[CoverLetter]
+        with self.assertNumQueries(1):
+            response = export_as_csv(modeladmin, None, CoverLetter.objects.all())
+            lines = b''.join(response.streaming_content).decode().splitlines()
+        self.assertEqual(len(lines), 4)  # header + 3 rows
+        self.assertIn('export@test.com', lines[1])
+
+
+class TemplateListCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            email='tpl@test.com',
+            password='testpass123'
+        )
+        self.template = CoverLetterTemplate.objects.create(id='cache-tpl', name='Cached Template')
+        self.client.force_authenticate(user=self.user)
+
+    def test_template_list_cached_until_template_changes(self):
+        self.client.get('/api/cover-letters/templates/')
+        with self.assertNumQueries(0):
+            response = self.client.get('/api/cover-letters/templates/')
+        self.assertIn('cache-tpl', [t['id'] for t in response.data])
+
+        self.template.is_active = False
+        self.template.save()
+        response = self.client.get('/api/cover-letters/templates/')
+        self.assertNotIn('cache-tpl', [t['id'] for t in response.data])
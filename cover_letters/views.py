@@ -1,17 +1,60 @@
 from rest_framework import viewsets, permissions, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
+from django.core.cache import cache
+from django.http import Http404
 from django.shortcuts import get_object_or_404
+from django.utils import timezone
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import condition
 from drf_spectacular.utils import extend_schema
 from resumes.permissions import IsOwnerOrAdmin
 from .models import CoverLetter, CoverLetterTemplate
-from .serializers import CoverLetterSerializer, CoverLetterTemplateSerializer
+from .serializers import (
+    CoverLetterSerializer,
+    CoverLetterListSerializer,
+    CoverLetterTemplateSerializer,
+    CoverLetterBulkShareSerializer,
+)
+from .signals import PUBLIC_LETTER_CACHE_KEY, TEMPLATE_LIST_CACHE_KEYS
 from resumes.services.share_service import ShareService
 from resumes.models import ShareLink
 import logging
+import uuid
 
 logger = logging.getLogger(__name__)
 
+# Backstop only: saves and admin actions invalidate the cached list directly
+TEMPLATE_LIST_CACHE_SECONDS = 3600
+
+# Rendered PDFs are keyed by updated_at stamps, so this only bounds cache usage
+PDF_CACHE_SECONDS = 60 * 60 * 24
+
+
+def _parse_id(pk):
+    """URL pk as a UUID; anything malformed is simply not found."""
+    try:
+        return uuid.UUID(str(pk))
+    except ValueError:
+        raise Http404
+
+
+def _cl_etag(request, pk=None, **kwargs):
+    """
+    Strong ETag for the caller's letter, read with a single small query.
+
+    The nested template is part of the payload (and the PDF), so its
+    updated_at is folded in alongside the letter's own.
+    """
+    stamps = CoverLetter.objects.filter(
+        pk=_parse_id(pk),
+        user=request.user,
+        deleted_at__isnull=True
+    ).values_list('updated_at', 'template__updated_at').first()
+    if stamps is None:
+        return None
+    return '-'.join(f"{ts.timestamp():.6f}" if ts else '0' for ts in stamps)
+
 
 @extend_schema(tags=['cover-letter-templates'])
 class CoverLetterTemplateViewSet(viewsets.ReadOnlyModelViewSet):
@@ -29,6 +72,15 @@ class CoverLetterTemplateViewSet(viewsets.ReadOnlyModelViewSet):
             return CoverLetterTemplate.objects.all()
         return CoverLetterTemplate.objects.filter(is_active=True)
 
+    def list(self, request, *args, **kwargs):
+        """Templates change rarely; serve the list from cache until one is edited."""
+        key = TEMPLATE_LIST_CACHE_KEYS[bool(request.user.is_staff)]
+        data = cache.get(key)
+        if data is None:
+            data = list(self.get_serializer(self.get_queryset(), many=True).data)
+            cache.set(key, data, timeout=TEMPLATE_LIST_CACHE_SECONDS)
+        return Response(data)
+
 
 @extend_schema(tags=['cover-letters'])
 class CoverLetterViewSet(viewsets.ModelViewSet):
@@ -36,34 +88,41 @@ class CoverLetterViewSet(viewsets.ModelViewSet):
     serializer_class = CoverLetterSerializer
     
     def get_queryset(self):
-        return CoverLetter.objects.filter(
+        # template_detail is nested in every row; join it rather than N+1
+        qs = CoverLetter.objects.select_related('template').filter(
             user=self.request.user,
             deleted_at__isnull=True
         )
+        if self.action == 'list':
+            # The list serializer shows neither; don't pull the large text columns
+            qs = qs.defer('body', 'job_description')
+        return qs
+
+    def get_serializer_class(self):
+        if self.action == 'list':
+            return CoverLetterListSerializer
+        return CoverLetterSerializer
 
     def perform_create(self, serializer):
         serializer.save(user=self.request.user)
 
+    @method_decorator(condition(etag_func=_cl_etag))
+    def retrieve(self, request, *args, **kwargs):
+        # Unchanged letters short-circuit to 304 before any serializer work
+        return super().retrieve(request, *args, **kwargs)
+
     @action(detail=True, methods=['post'])
     def duplicate(self, request, pk=None):
-        cl = self.get_object()
-        new_cl = CoverLetter.objects.create(
-            user=request.user,
-            linked_resume=cl.linked_resume,
-            title=f"{cl.title} (Copy)",
-            company_name=cl.company_name,
-            job_title=cl.job_title,
-            job_description=cl.job_description,
-            body=cl.body,
-            status=cl.status
-        )
+        # Copied inside the database; only the new row is read back
+        new_id = CoverLetter.duplicate_in_db(_parse_id(pk), request.user)
+        if new_id is None:
+            raise Http404
+        new_cl = self.get_queryset().get(pk=new_id)
         return Response(CoverLetterSerializer(new_cl).data, status=status.HTTP_201_CREATED)
 
     @action(detail=True, methods=['post'])
     def soft_delete(self, request, pk=None):
-        cl = self.get_object()
-        cl.soft_delete()
-        return Response(status=status.HTTP_204_NO_CONTENT)
+        return self._soft_delete(pk)
 
     @action(detail=True, methods=['post', 'delete'])
     def share(self, request, pk=None):
@@ -79,11 +138,42 @@ class CoverLetterViewSet(viewsets.ModelViewSet):
             "expires_at": link.expires_at
         })
     
+    @extend_schema(
+        summary="Share several cover letters at once",
+        request=CoverLetterBulkShareSerializer,
+    )
+    @action(detail=False, methods=['post'], url_path='bulk-share')
+    def bulk_share(self, request):
+        serializer = CoverLetterBulkShareSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        ids = set(serializer.validated_data['ids'])
+
+        # One ownership check for the whole batch
+        owned = list(
+            self.get_queryset().filter(id__in=ids).values_list('id', flat=True)
+        )
+        if len(owned) != len(ids):
+            return Response(
+                {"detail": "One or more cover letters were not found."},
+                status=status.HTTP_404_NOT_FOUND
+            )
+
+        links = ShareService.create_links(request.user, ShareLink.ResourceType.COVER_LETTER, owned)
+        return Response({
+            str(cl_id): {
+                "token": link.token,
+                "url": f"/public/c/{link.token}/",
+                "expires_at": link.expires_at
+            }
+            for cl_id, link in links.items()
+        })
+
     @extend_schema(
         summary="Download cover letter as PDF",
         description="Generate and download PDF version of cover letter"
     )
     @action(detail=True, methods=['get'])
+    @method_decorator(condition(etag_func=_cl_etag))
     def pdf(self, request, pk=None):
         """Generate and download PDF."""
         from resumes.services.pdf_service import PdfService
@@ -93,14 +183,22 @@ class CoverLetterViewSet(viewsets.ModelViewSet):
         cl = self.get_object()
         
         try:
-            pdf_service = PdfService()
-            if not pdf_service.provider and not settings.DEBUG:
-                return Response(
-                    {"detail": "PDF provider not configured"},
-                    status=status.HTTP_503_SERVICE_UNAVAILABLE
-                )
-                
-            pdf_content = pdf_service.generate_cover_letter_pdf(cl)
+            # Keyed like _cl_etag: editing the letter or its template forces a new render
+            template_stamp = cl.template.updated_at.timestamp() if cl.template_id else 0
+            cache_key = f"cl:pdf:{cl.id}:{cl.updated_at.timestamp()}:{template_stamp}"
+            pdf_content = cache.get(cache_key)
+            if pdf_content is None:
+                pdf_service = PdfService()
+                if not pdf_service.provider and not settings.DEBUG:
+                    return Response(
+                        {"detail": "PDF provider not configured"},
+                        status=status.HTTP_503_SERVICE_UNAVAILABLE
+                    )
+
+                pdf_content = pdf_service.generate_cover_letter_pdf(cl)
+                # The DEBUG placeholder must not outlive a provider being configured
+                if pdf_service.provider:
+                    cache.set(cache_key, pdf_content, timeout=PDF_CACHE_SECONDS)
             
             response = HttpResponse(pdf_content, content_type='application/pdf')
             filename = f"cover-letter-{cl.id}.pdf"
@@ -108,13 +206,21 @@ class CoverLetterViewSet(viewsets.ModelViewSet):
             return response
             
         except Exception as e:
-            logger.error(f"CL PDF generation failed: {e}")
+            logger.error("CL PDF generation failed: %s", e, exc_info=True)
             return Response(
                 {"detail": "Failed to generate PDF"},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
 
     def destroy(self, request, *args, **kwargs):
-        cl = self.get_object()
-        cl.soft_delete()
+        return self._soft_delete(kwargs.get('pk'))
+
+    def _soft_delete(self, pk):
+        """Soft-delete the caller's letter with one UPDATE (no SELECT first)."""
+        cl_id = _parse_id(pk)
+        updated = self.get_queryset().filter(pk=cl_id).update(deleted_at=timezone.now())
+        if not updated:
+            raise Http404
+        # update() sends no post_save; stop serving the shared copy now
+        cache.delete(PUBLIC_LETTER_CACHE_KEY.format(cl_id))
         return Response(status=status.HTTP_204_NO_CONTENT)
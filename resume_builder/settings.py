@@ -72,6 +72,7 @@ MIDDLEWARE = [
     'allauth.account.middleware.AccountMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'ai_core.middleware.FlushAIUsageMiddleware',
 ]
 
 
@@ -106,10 +107,33 @@ DATABASES = {
         'PASSWORD': env("DB_PASSWORD", default=""),
         'HOST': env("DB_HOST", default=""),
         'PORT': env("DB_PORT", default=""),
+        # Reuse connections across requests instead of reconnecting each time
+        'CONN_MAX_AGE': env.int("DB_CONN_MAX_AGE", default=600),
+        'CONN_HEALTH_CHECKS': True,
+        # Must be True when HOST/PORT point at PgBouncer in transaction pooling mode
+        'DISABLE_SERVER_SIDE_CURSORS': env.bool("DB_DISABLE_SERVER_SIDE_CURSORS", default=False),
     }
 }
 
 
+# ========== CACHE ==========
+# Per-process memory by default; set REDIS_URL to share it across workers
+REDIS_URL = env("REDIS_URL", default="")
+if REDIS_URL:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        }
+    }
+
+
 # ========== AUTH MODEL ==========
 AUTH_USER_MODEL = "accounts.User"
 
@@ -197,6 +221,10 @@ REST_FRAMEWORK = {
     ),
     "DEFAULT_PERMISSION_CLASSES": (
         "rest_framework.permissions.IsAuthenticated",
+    ),
+    "DEFAULT_RENDERER_CLASSES": (
+        "resumes.renderers.ORJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
     ),
      "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
          'DEFAULT_THROTTLE_CLASSES': [
@@ -225,7 +253,7 @@ LOGGING = {
     },
     'formatters': {
         'verbose': {
-            'format': '{levelname} {asctime} {module} {process:d} {thread:d} {message}',
+            'format': '{levelname} {asctime} {module} {message}',
             'style': '{',
         },
     },
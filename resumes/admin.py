@@ -1,15 +1,18 @@
 # resumes/admin.py
 import csv
-import json
 from datetime import timedelta
 
+import orjson
 from django.contrib import admin
 from django.contrib.admin import SimpleListFilter
-from django.db.models import Count
-from django.http import HttpResponse
+from django.db.models import Count, F, OuterRef, Subquery
+from django.db.models.functions import Coalesce
 from django.utils import timezone
 from django.utils.html import format_html
 
+from accounts.exports import EXPORT_CHUNK_SIZE, _Echo, export_response
+from accounts.paginators import ApproxCountPaginator
+
 from .models import (
     Template,
     Resume,
@@ -56,7 +59,9 @@ class DateRangeFilter(SimpleListFilter):
     def queryset(self, request, queryset):
         now = timezone.now()
         if self.value() == "today":
-            return queryset.filter(created_at__date=now.date())
+            # Half-open range instead of __date, so an index on created_at can serve it
+            start = timezone.localtime(now).replace(hour=0, minute=0, second=0, microsecond=0)
+            return queryset.filter(created_at__gte=start, created_at__lt=start + timedelta(days=1))
         if self.value() == "7d":
             return queryset.filter(created_at__gte=now - timedelta(days=7))
         if self.value() == "30d":
@@ -64,33 +69,67 @@ class DateRangeFilter(SimpleListFilter):
         return queryset
 
 
+def _badge(color, label):
+    return format_html(
+        "<span style='padding:2px 8px;border-radius:10px;background:{};color:#fff;font-size:12px'>{}</span>",
+        color, label
+    )
+
+
+# Changelist badges are rendered once here, not per row
+_STATUS_COLORS = {"draft": "#6b7280", "published": "#16a34a", "archived": "#f59e0b"}
+STATUS_BADGES = {
+    value: _badge(_STATUS_COLORS.get(value, "#3b82f6"), label)
+    for value, label in Resume.Status.choices
+}
+AI_BADGE = _badge("#7c3aed", "AI")
+DELETED_BADGE = _badge("#dc2626", "Deleted")
+
+
+def _export_rows(queryset, fields):
+    # Exports only read concrete columns: join the FKs, skip the changelist prefetches
+    relations = [f.name for f in fields if f.is_relation]
+    return queryset.select_related(*relations).prefetch_related(None).iterator(chunk_size=EXPORT_CHUNK_SIZE)
+
+
 def export_as_csv(modeladmin, request, queryset):
-    model = modeladmin.model
-    meta = model._meta
-    field_names = [f.name for f in meta.fields]
+    meta = modeladmin.model._meta
+    # Raw column values (FKs as ids): csv.writer takes the tuples as-is, no model instances
+    columns = [f.attname for f in meta.fields]
+    writer = csv.writer(_Echo())
+
+    def rows():
+        yield writer.writerow(columns)
+        values = queryset.prefetch_related(None).values_list(*columns).iterator(chunk_size=EXPORT_CHUNK_SIZE)
+        for row in values:
+            yield writer.writerow(row)
 
-    response = HttpResponse(content_type="text/csv")
-    response["Content-Disposition"] = f'attachment; filename="{meta.model_name}.csv"'
+    return export_response(request, rows(), "text/csv", f"{meta.model_name}.csv")
 
-    writer = csv.writer(response)
-    writer.writerow(field_names)
-    for obj in queryset:
-        writer.writerow([getattr(obj, f) for f in field_names])
-    return response
+
+def _pretty_json(data):
+    # orjson indents large JSONField payloads several times faster than json.dumps
+    return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+
+
+def _json_value(val):
+    return str(val) if hasattr(val, "hex") else val
 
 
 def export_as_json(modeladmin, request, queryset):
-    data = []
-    for obj in queryset:
-        row = {}
-        for f in obj._meta.fields:
-            val = getattr(obj, f.name)
-            row[f.name] = str(val) if hasattr(val, "hex") else val
-        data.append(row)
+    fields = modeladmin.model._meta.fields
+    field_names = [f.name for f in fields]
+
+    def rows():
+        yield b"["
+        separator = b"\n"
+        for obj in _export_rows(queryset, fields):
+            row = {f: _json_value(getattr(obj, f)) for f in field_names}
+            yield separator + orjson.dumps(row, default=str, option=orjson.OPT_INDENT_2)
+            separator = b",\n"
+        yield b"\n]"
 
-    response = HttpResponse(json.dumps(data, indent=2, default=str), content_type="application/json")
-    response["Content-Disposition"] = f'attachment; filename="{modeladmin.model._meta.model_name}.json"'
-    return response
+    return export_response(request, rows(), "application/json", f"{modeladmin.model._meta.model_name}.json")
 
 
 export_as_csv.short_description = "Export selected as CSV"
@@ -159,7 +198,11 @@ class TemplateAdmin(admin.ModelAdmin):
 
     def get_queryset(self, request):
         qs = super().get_queryset(request)
-        return qs.annotate(_resume_count=Count("resume"))
+        # Correlated subquery rather than JOIN + GROUP BY, so the paginator's COUNT stays plain
+        resumes = Resume.objects.filter(template=OuterRef("pk")).order_by().values("template")
+        return qs.annotate(
+            _resume_count=Coalesce(Subquery(resumes.annotate(c=Count("*")).values("c")), 0)
+        )
 
     def usage_count(self, obj):
         return getattr(obj, "_resume_count", 0)
@@ -170,7 +213,7 @@ class TemplateAdmin(admin.ModelAdmin):
         try:
             return format_html(
                 "<pre style='max-height:300px;overflow:auto'>{}</pre>",
-                json.dumps(obj.definition or {}, indent=2)
+                _pretty_json(obj.definition or {})
             )
         except Exception:
             return "Invalid JSON"
@@ -205,6 +248,8 @@ class ResumeAdmin(admin.ModelAdmin):
     list_filter = (DeletedFilter, "status", "language", "template", "is_ai_generated", DateRangeFilter)
     search_fields = ("title", "user__email", "target_role", "slug", "user__first_name", "user__last_name")
     ordering = ("-updated_at",)
+    paginator = ApproxCountPaginator
+    show_full_result_count = False
     readonly_fields = ("id", "slug", "created_at", "updated_at", "last_edited_at", "deleted_at", "share_links_preview")
     fieldsets = (
         ("Basic Info", {"fields": ("user", "title", "slug", "target_role")}),
@@ -221,37 +266,35 @@ class ResumeAdmin(admin.ModelAdmin):
     ]
 
     def get_queryset(self, request):
+        # list_display only reads user/template. Inlines build their own formset
+        # querysets, so prefetching child sections here was never used
         qs = super().get_queryset(request)
-        return qs.select_related("user", "template").prefetch_related(
-            "work_experiences", "educations", "skill_categories", "strengths", "hobbies", "custom_sections"
-        )
+        return qs.select_related("user", "template")
 
     def user_email(self, obj):
         return obj.user.email
     user_email.short_description = "User"
 
     def status_badge(self, obj):
-        color = {"draft": "#6b7280", "published": "#16a34a", "archived": "#f59e0b"}.get(obj.status, "#3b82f6")
-        return format_html(
-            "<span style='padding:2px 8px;border-radius:10px;background:{};color:#fff;font-size:12px'>{}</span>",
-            color, obj.get_status_display()
-        )
+        badge = STATUS_BADGES.get(obj.status)
+        return badge if badge is not None else _badge("#3b82f6", obj.get_status_display())
     status_badge.short_description = "Status"
 
     def ai_badge(self, obj):
-        if obj.is_ai_generated:
-            return format_html("<span style='padding:2px 8px;border-radius:10px;background:#7c3aed;color:#fff;font-size:12px'>AI</span>")
-        return ""
+        return AI_BADGE if obj.is_ai_generated else ""
     ai_badge.short_description = "AI"
 
     def deleted_badge(self, obj):
-        if obj.deleted_at:
-            return format_html("<span style='padding:2px 8px;border-radius:10px;background:#dc2626;color:#fff;font-size:12px'>Deleted</span>")
-        return ""
+        return DELETED_BADGE if obj.deleted_at else ""
     deleted_badge.short_description = "Deleted"
 
     def share_links_preview(self, obj):
-        links = ShareLink.objects.filter(resource_type="resume", resource_id=obj.id).order_by("-created_at")[:10]
+        # Change form only (one resume), so this is a single query, not N+1
+        links = list(
+            ShareLink.objects.filter(resource_type="resume", resource_id=obj.id)
+            .only("is_active", "expires_at", "token")
+            .order_by("-created_at")[:10]
+        )
         if not links:
             return "No share links."
         rows = []
@@ -274,8 +317,8 @@ class ResumeAdmin(admin.ModelAdmin):
 
     @admin.action(description="Soft delete selected resumes")
     def soft_delete_resumes(self, request, queryset):
-        for r in queryset:
-            r.soft_delete()
+        # Same column Resume.soft_delete() sets, in one UPDATE (no signals hang off it)
+        queryset.update(deleted_at=timezone.now())
 
     @admin.action(description="Restore selected resumes (clear deleted_at)")
     def restore_resumes(self, request, queryset):
@@ -345,11 +388,11 @@ class ResumeWizardSessionAdmin(admin.ModelAdmin):
     expired_flag.short_description = "Expired?"
 
     def input_preview(self, obj):
-        return format_html("<pre style='max-height:260px;overflow:auto'>{}</pre>", json.dumps(obj.input_payload, indent=2))
+        return format_html("<pre style='max-height:260px;overflow:auto'>{}</pre>", _pretty_json(obj.input_payload))
     input_preview.short_description = "Input JSON"
 
     def draft_preview(self, obj):
-        return format_html("<pre style='max-height:260px;overflow:auto'>{}</pre>", json.dumps(obj.draft_payload, indent=2))
+        return format_html("<pre style='max-height:260px;overflow:auto'>{}</pre>", _pretty_json(obj.draft_payload))
     draft_preview.short_description = "Draft JSON"
 
 
@@ -360,6 +403,8 @@ class ShareLinkAdmin(admin.ModelAdmin):
     search_fields = ("user__email", "token", "resource_id")
     readonly_fields = ("id", "created_at", "last_accessed_at", "revoked_at", "open_url")
     ordering = ("-created_at",)
+    paginator = ApproxCountPaginator
+    show_full_result_count = False
     actions = ["revoke_links", "activate_links", "extend_7_days", export_as_csv, export_as_json]
 
     def open_url(self, obj):
@@ -377,14 +422,14 @@ class ShareLinkAdmin(admin.ModelAdmin):
 
     @admin.action(description="Extend expiry by 7 days (only those with expires_at set)")
     def extend_7_days(self, request, queryset):
-        for link in queryset.exclude(expires_at__isnull=True):
-            link.expires_at = link.expires_at + timedelta(days=7)
-            link.save(update_fields=["expires_at"])
+        queryset.exclude(expires_at__isnull=True).update(expires_at=F("expires_at") + timedelta(days=7))
 
 
 @admin.register(ResumeVersion)
 class ResumeVersionAdmin(admin.ModelAdmin):
     list_display = ("resume", "version_number", "created_at", "created_by")
+    # created_by is nullable, so the admin's automatic select_related() skips it
+    list_select_related = ("resume__user", "created_by")
     list_filter = ("created_at", DateRangeFilter)
     search_fields = ("resume__title", "created_by__email")
     readonly_fields = ("id", "created_at", "snapshot_preview")
@@ -392,5 +437,5 @@ class ResumeVersionAdmin(admin.ModelAdmin):
     actions = [export_as_csv, export_as_json]
 
     def snapshot_preview(self, obj):
-        return format_html("<pre style='max-height:380px;overflow:auto'>{}</pre>", json.dumps(obj.snapshot_data, indent=2))
+        return format_html("<pre style='max-height:380px;overflow:auto'>{}</pre>", _pretty_json(obj.snapshot_data))
     snapshot_preview.short_description = "Snapshot JSON"
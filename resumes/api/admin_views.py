@@ -1,10 +1,14 @@
 from rest_framework import viewsets, permissions, status, filters
 from rest_framework.decorators import action
+from rest_framework.pagination import CursorPagination
 from rest_framework.response import Response
 from django.contrib.auth import get_user_model
-from django.db.models import Q, Count
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
 from drf_spectacular.utils import extend_schema, OpenApiParameter
-from resumes.models import Template
+from resumes.models import Resume, Template
+from cover_letters.models import CoverLetter, CoverLetterTemplate
+from cover_letters.serializers import CoverLetterTemplateSerializer
 from ai_core.models import AIUsageLog
 from resumes.serializers import TemplateSerializer
 import logging
@@ -75,6 +79,12 @@ class AIUsageLogSerializer(serializers.ModelSerializer):
         ]
 
 
+def _live_count(model):
+    """Number of the user's non-deleted `model` rows, as a subquery."""
+    rows = model.objects.filter(user=OuterRef('pk'), deleted_at__isnull=True).order_by().values('user')
+    return Coalesce(Subquery(rows.annotate(c=Count('*')).values('c')), 0)
+
+
 @extend_schema(tags=['admin'])
 class AdminUserViewSet(viewsets.ModelViewSet):
     permission_classes = [IsAdminUser]
@@ -90,19 +100,12 @@ class AdminUserViewSet(viewsets.ModelViewSet):
         return AdminUserDetailSerializer
     
     def get_queryset(self):
-        queryset = User.objects.annotate(
-            resume_count=Count('resumes', filter=Q(resumes__deleted_at__isnull=True))
-        )
-        
-        # Add cover letter count if available
-        try:
-            from cover_letters.models import CoverLetter
-            queryset = queryset.annotate(
-                cover_letter_count=Count('cover_letters', filter=Q(cover_letters__deleted_at__isnull=True))
-            )
-        except:
-            pass
-            
+        # One correlated COUNT per column: two Count() joins in the same query
+        # would fan out (resumes x cover letters) and inflate both numbers
+        queryset = User.objects.annotate(resume_count=_live_count(Resume))
+        if self.action != 'list':
+            # Only the detail serializer shows it
+            queryset = queryset.annotate(cover_letter_count=_live_count(CoverLetter))
         return queryset
     
     @extend_schema(
@@ -135,13 +138,28 @@ class AdminTemplateViewSet(viewsets.ModelViewSet):
         return Response(TemplateSerializer(template).data)
 
 
+class AILogCursorPagination(CursorPagination):
+    """
+    Keyset pages over the created_at index: each page seeks from the last
+    row seen instead of skipping OFFSET rows, so deep pages stay cheap.
+    """
+    ordering = '-created_at'
+    page_size = 100
+
+
 @extend_schema(tags=['admin'])
 class AdminAILogViewSet(viewsets.ReadOnlyModelViewSet):
     permission_classes = [IsAdminUser]
     serializer_class = AIUsageLogSerializer
-    queryset = AIUsageLog.objects.select_related('user').all()
+    # Only the serialized columns, plus the one User column behind user_email
+    queryset = AIUsageLog.objects.select_related('user').only(
+        *(f for f in AIUsageLogSerializer.Meta.fields if f != 'user_email'), 'user__email'
+    )
     filter_backends = [filters.OrderingFilter]
+    # The cursor needs a stable sort; other columns would repeat or skip rows
+    ordering_fields = ['created_at']
     ordering = ['-created_at']
+    pagination_class = AILogCursorPagination
     
     def get_queryset(self):
         queryset = super().get_queryset()
@@ -176,18 +194,10 @@ class AdminAILogViewSet(viewsets.ReadOnlyModelViewSet):
 class AdminCoverLetterTemplateViewSet(viewsets.ModelViewSet):
     """Admin viewset for managing cover letter templates."""
     permission_classes = [IsAdminUser]
-    queryset = None
-    serializer_class = None
+    queryset = CoverLetterTemplate.objects.all()
+    serializer_class = CoverLetterTemplateSerializer
     ordering = ['-created_at']
     
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        # Import here to avoid circular import
-        from cover_letters.models import CoverLetterTemplate
-        from cover_letters.serializers import CoverLetterTemplateSerializer
-        self.queryset = CoverLetterTemplate.objects.all()
-        self.serializer_class = CoverLetterTemplateSerializer
-    
     @action(detail=True, methods=['post'])
     def toggle_active(self, request, pk=None):
         """Toggle template active status."""
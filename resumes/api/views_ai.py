@@ -41,7 +41,7 @@ class BaseAIView(APIView):
                 }
             })
         except Exception as e:
-            logger.error(f"AI Error in {method_name}: {e}")
+            logger.error("AI Error in %s: %s", method_name, e)
             return Response(
                 {"detail": str(e)},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -106,5 +106,5 @@ class AICoverLetterFullView(BaseAIView):
                 "meta": {"model": service.model}
             })
         except Exception as e:
-            logger.error(f"AI Cover Letter Error: {e}")
+            logger.error("AI Cover Letter Error: %s", e)
             return Response({"detail": str(e)}, status=500)
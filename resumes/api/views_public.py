@@ -1,14 +1,19 @@
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import permissions, status
+from django.core.cache import cache
 from django.shortcuts import get_object_or_404
 from django.utils import timezone
 from resumes.models import Resume, ShareLink
 from cover_letters.models import CoverLetter
 from resumes.serializers_public import ResumePublicSerializer
 from cover_letters.serializers_public import CoverLetterPublicSerializer
+from cover_letters.signals import PUBLIC_LETTER_CACHE_KEY
 from resumes.services.share_service import ShareService
 
+# Saves and deletes drop the cached payload, so this only bounds staleness
+PUBLIC_LETTER_CACHE_SECONDS = 60
+
 class PublicResumeView(APIView):
     permission_classes = [permissions.AllowAny]
 
@@ -45,12 +50,21 @@ class PublicCoverLetterView(APIView):
         if link.expires_at and link.expires_at <= timezone.now():
             return Response(status=status.HTTP_404_NOT_FOUND)
         
-        # Get cover letter and check soft-delete
-        try:
-            cl = CoverLetter.objects.get(id=link.resource_id, deleted_at__isnull=True)
-        except CoverLetter.DoesNotExist:
-            return Response(status=status.HTTP_404_NOT_FOUND)
-        
-        # Serialize with public serializer (no sensitive fields)
-        serializer = CoverLetterPublicSerializer(cl)
-        return Response(serializer.data)
+        # The link itself is always checked above so revocation is immediate;
+        # only the letter payload is cached
+        cache_key = PUBLIC_LETTER_CACHE_KEY.format(link.resource_id)
+        data = cache.get(cache_key)
+        if data is None:
+            # Get cover letter and check soft-delete
+            try:
+                # Body is stored ready to show; skip the columns the public view never exposes
+                cl = CoverLetter.objects.only(
+                    *CoverLetterPublicSerializer.Meta.fields
+                ).get(id=link.resource_id, deleted_at__isnull=True)
+            except CoverLetter.DoesNotExist:
+                return Response(status=status.HTTP_404_NOT_FOUND)
+
+            # Serialize with public serializer (no sensitive fields)
+            data = CoverLetterPublicSerializer(cl).data
+            cache.set(cache_key, data, timeout=PUBLIC_LETTER_CACHE_SECONDS)
+        return Response(data)
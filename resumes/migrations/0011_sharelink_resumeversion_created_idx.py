@@ -0,0 +1,21 @@
+# Generated by Django 5.2.8 on 2026-10-16 15:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('resumes', '0010_resumeversion'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='sharelink',
+            index=models.Index(fields=['created_at'], name='sharelink_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='resumeversion',
+            index=models.Index(fields=['created_at'], name='resumeversion_created_idx'),
+        ),
+    ]
@@ -440,6 +440,7 @@ class ShareLink(models.Model):
         indexes = [
             models.Index(fields=['token']),
             models.Index(fields=['resource_id', 'resource_type']),
+            models.Index(fields=['created_at'], name='sharelink_created_idx'),
         ]
 
     def __str__(self):
@@ -469,6 +470,7 @@ class ResumeVersion(models.Model):
         ordering = ['-version_number']
         indexes = [
             models.Index(fields=['resume', '-version_number']),
+            models.Index(fields=['created_at'], name='resumeversion_created_idx'),
         ]
 
     def __str__(self):
@@ -0,0 +1,33 @@
+import orjson
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+# orjson covers UUID/datetime/dict/list natively; anything else
+# (Decimal, lazy translations, querysets) goes through DRF's encoder
+_fallback = JSONEncoder().default
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    Drop-in JSONRenderer backed by orjson.
+
+    Like the stock renderer it emits compact UTF-8, keeps the trailing "Z"
+    on UTC datetimes and escapes U+2028/U+2029 for JavaScript. It differs in
+    two ways: NaN/Infinity are written as null rather than rejected, and
+    raw datetimes keep full microseconds instead of milliseconds (serializer
+    fields already format their own datetimes, so this only affects
+    datetimes placed in a response by hand).
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+
+        option = orjson.OPT_UTC_Z
+        renderer_context = renderer_context or {}
+        if self.get_indent(accepted_media_type, renderer_context):
+            option |= orjson.OPT_INDENT_2
+
+        ret = orjson.dumps(data, default=_fallback, option=option)
+        # Valid JSON but not valid JavaScript; escape them as JSONRenderer does
+        return ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
@@ -49,7 +49,7 @@ class AIResumeService:
                 validated_data = self._validate_and_normalize_resume(resume_data, user_input, user_data)
                 
                 # Log successful generation
-                AILogService.log_usage(
+                AILogService.queue_usage(
                     user=user,
                     feature_type=AIUsageLog.FeatureType.RESUME_PREVIEW,
                     model_name=self.model,
@@ -58,35 +58,35 @@ class AIResumeService:
                     tokens_out=response.usage.completion_tokens,
                     success=True
                 )
-                logger.info(f"AI resume generated successfully for user {user.email}")
+                logger.info("AI resume generated successfully for user %s", user.email)
                 return validated_data
                 
             except json.JSONDecodeError as e:
-                logger.error(f"Failed to parse AI response (attempt {attempt + 1}): {e}")
+                logger.error("Failed to parse AI response (attempt %s): %s", attempt + 1, e)
                 if attempt == self.max_retries - 1:
                     raise ValueError("Failed to generate valid resume data")
                 time.sleep(1)
                 
             except RateLimitError as e:
-                logger.warning(f"Rate limit hit (attempt {attempt + 1}): {e}")
+                logger.warning("Rate limit hit (attempt %s): %s", attempt + 1, e)
                 if attempt == self.max_retries - 1:
                     raise
                 time.sleep(2 ** attempt)  # Exponential backoff
                 
             except (APIError, APITimeoutError) as e:
-                logger.error(f"OpenAI API error (attempt {attempt + 1}): {e}")
+                logger.error("OpenAI API error (attempt %s): %s", attempt + 1, e)
                 if attempt == self.max_retries - 1:
                     raise
                 time.sleep(1)
                 
             except Exception as e:
-                logger.error(f"Unexpected error in AI service (attempt {attempt + 1}): {e}")
+                logger.error("Unexpected error in AI service (attempt %s): %s", attempt + 1, e)
                 if attempt == self.max_retries - 1:
                     raise
                 time.sleep(1)
         
         # Log failure
-        AILogService.log_usage(
+        AILogService.queue_usage(
             user=user,
             feature_type=AIUsageLog.FeatureType.RESUME_PREVIEW,
             model_name=self.model,
@@ -137,7 +137,7 @@ class AIResumeService:
                  # Check values
                  bullets = list(json.loads(content).values())[0]
 
-            AILogService.log_usage(
+            AILogService.queue_usage(
                 user=user,
                 feature_type=AIUsageLog.FeatureType.BULLETS,
                 model_name=self.model,
@@ -148,7 +148,7 @@ class AIResumeService:
             )
             return bullets
         except Exception as e:
-            AILogService.log_usage(user, AIUsageLog.FeatureType.BULLETS, self.model, prompt, success=False, error_message=str(e))
+            AILogService.queue_usage(user, AIUsageLog.FeatureType.BULLETS, self.model, prompt, success=False, error_message=str(e))
             raise e
 
     def generate_experience(self, user, role, company, keywords=None, tone='professional'):
@@ -199,7 +199,7 @@ class AIResumeService:
             )
             data = json.loads(response.choices[0].message.content)
             
-            AILogService.log_usage(
+            AILogService.queue_usage(
                 user=user,
                 feature_type=AIUsageLog.FeatureType.COVER_LETTER_FULL,
                 model_name=self.model,
@@ -210,7 +210,7 @@ class AIResumeService:
             )
             return data
         except Exception as e:
-            AILogService.log_usage(user, AIUsageLog.FeatureType.COVER_LETTER_FULL, self.model, prompt, success=False, error_message=str(e))
+            AILogService.queue_usage(user, AIUsageLog.FeatureType.COVER_LETTER_FULL, self.model, prompt, success=False, error_message=str(e))
             raise e
 
     def _generate_text(self, user, prompt, feature_type, tone):
@@ -226,7 +226,7 @@ class AIResumeService:
             )
             text = response.choices[0].message.content.strip()
             
-            AILogService.log_usage(
+            AILogService.queue_usage(
                 user=user,
                 feature_type=feature_type,
                 model_name=self.model,
@@ -237,7 +237,7 @@ class AIResumeService:
             )
             return text
         except Exception as e:
-            AILogService.log_usage(user, feature_type, self.model, prompt, success=False, error_message=str(e))
+            AILogService.queue_usage(user, feature_type, self.model, prompt, success=False, error_message=str(e))
             raise e
     
     def rewrite_section(self, user, original_text: str, prompt: str, tone: str = 'professional') -> str:
@@ -269,7 +269,7 @@ class AIResumeService:
                 
                 rewritten = response.choices[0].message.content.strip()
                 
-                AILogService.log_usage(
+                AILogService.queue_usage(
                     user=user,
                     feature_type=AIUsageLog.FeatureType.REWRITE,
                     model_name=self.model,
@@ -279,20 +279,20 @@ class AIResumeService:
                     success=True
                 )
                 
-                logger.info(f"Section rewritten successfully (tone: {tone})")
+                logger.info("Section rewritten successfully (tone: %s)", tone)
                 return rewritten
                 
             except RateLimitError as e:
-                logger.warning(f"Rate limit hit in rewrite (attempt {attempt + 1}): {e}")
+                logger.warning("Rate limit hit in rewrite (attempt %s): %s", attempt + 1, e)
                 if attempt == self.max_retries - 1:
-                    AILogService.log_usage(user, AIUsageLog.FeatureType.REWRITE, self.model, prompt, success=False, error_message=str(e))
+                    AILogService.queue_usage(user, AIUsageLog.FeatureType.REWRITE, self.model, prompt, success=False, error_message=str(e))
                     return original_text
                 time.sleep(2 ** attempt)
                 
             except Exception as e:
-                logger.error(f"Error in rewrite (attempt {attempt + 1}): {e}")
+                logger.error("Error in rewrite (attempt %s): %s", attempt + 1, e)
                 if attempt == self.max_retries - 1:
-                    AILogService.log_usage(user, AIUsageLog.FeatureType.REWRITE, self.model, prompt, success=False, error_message=str(e))
+                    AILogService.queue_usage(user, AIUsageLog.FeatureType.REWRITE, self.model, prompt, success=False, error_message=str(e))
                     return original_text
                 time.sleep(1)
         
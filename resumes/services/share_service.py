@@ -49,6 +49,54 @@ class ShareService:
         
         return link
 
+    @staticmethod
+    def create_links(user, resource_type, resource_ids, expires_at=None):
+        """
+        Batch form of create_link for many resources of one type.
+        Returns {resource_id: ShareLink}; existing unexpired links are reused.
+        """
+        now = timezone.now()
+        if expires_at is None:
+            expires_at = now + timedelta(days=DEFAULT_SHARE_DAYS)
+
+        active = ShareLink.objects.filter(
+            user=user,
+            resource_type=resource_type,
+            resource_id__in=resource_ids,
+            is_active=True,
+            revoked_at__isnull=True
+        )
+
+        links = {}
+        expired = []
+        for link in active:
+            if link.expires_at and link.expires_at < now:
+                expired.append(link.pk)
+            else:
+                links.setdefault(link.resource_id, link)
+
+        # Deactivate expired links in one UPDATE
+        if expired:
+            ShareLink.objects.filter(pk__in=expired).update(is_active=False)
+
+        # Create the missing links in one INSERT
+        new_links = [
+            ShareLink(
+                user=user,
+                resource_type=resource_type,
+                resource_id=resource_id,
+                token=secrets.token_urlsafe(32),
+                is_active=True,
+                expires_at=expires_at
+            )
+            for resource_id in resource_ids
+            if resource_id not in links
+        ]
+        for link in ShareLink.objects.bulk_create(new_links):
+            links[link.resource_id] = link
+
+        return links
+
     @staticmethod
     def revoke_link(user, resource_type, resource_id):
         """Revoke all active links for a resource."""
@@ -29,8 +29,13 @@ class VersionService:
         snapshot_data = serializer.data
         
         # Get next version number
-        last_version = ResumeVersion.objects.filter(resume=resume).first()
-        version_number = (last_version.version_number + 1) if last_version else 1
+        # Only the number is needed; skip loading the last snapshot's JSON
+        last_number = (
+            ResumeVersion.objects.filter(resume=resume)
+            .values_list('version_number', flat=True)
+            .first()
+        )
+        version_number = (last_number + 1) if last_number else 1
         
         # Create version
         version = ResumeVersion.objects.create(
@@ -43,7 +48,7 @@ class VersionService:
         # Prune old versions if exceeding limit
         VersionService._prune_old_versions(resume)
         
-        logger.info(f"Created version {version_number} for resume {resume.id}")
+        logger.info("Created version %s for resume %s", version_number, resume.id)
         return version
     
     @staticmethod
@@ -55,7 +60,7 @@ class VersionService:
             deleted_count = len(to_delete)
             for version in to_delete:
                 version.delete()
-            logger.info(f"Pruned {deleted_count} old versions for resume {resume.id}")
+            logger.info("Pruned %s old versions for resume %s", deleted_count, resume.id)
     
     @staticmethod
     @transaction.atomic
@@ -184,5 +189,5 @@ class VersionService:
                         **{k: v for k, v in item_data.items() if k not in ['id']}
                     )
         
-        logger.info(f"Restored resume {resume.id} to version {version.version_number}")
+        logger.info("Restored resume %s to version %s", resume.id, version.version_number)
         return resume
@@ -1,10 +1,14 @@
-from django.test import TestCase
+from django.contrib.admin.sites import site
+from django.test import RequestFactory, TestCase
 from django.urls import reverse
 from rest_framework.test import APIClient
 from rest_framework import status
 from django.contrib.auth import get_user_model
+from .admin import export_as_csv, export_as_json
 from .models import Template, Resume, ResumeWizardSession
 from django.utils import timezone
+import gzip
+import json
 import uuid
 
 User = get_user_model()
@@ -264,3 +268,36 @@ class TemplateDefinitionTests(TestCase):
         response = self.client.post(reverse('admin-template-list'), data, format='json')
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
         self.assertIn('visible', str(response.data))
+
+
+class AdminExportTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(email='export@test.com', password='testpass123')
+        template = Template.objects.create(id='export-tpl', name='Export Template')
+        for i in range(3):
+            Resume.objects.create(user=self.user, title=f'Resume {i}', template=template)
+
+    def test_json_export_streams_without_prefetches(self):
+        modeladmin = site._registry[Resume]
+        queryset = modeladmin.get_queryset(None)
+        with self.assertNumQueries(1):
+            response = export_as_json(modeladmin, None, queryset)
+            rows = json.loads(b''.join(response.streaming_content))
+        self.assertEqual(len(rows), 3)
+        self.assertEqual(rows[0]['user'], str(self.user))
+
+    def test_csv_export_writes_raw_column_values(self):
+        modeladmin = site._registry[Resume]
+        with self.assertNumQueries(1):
+            response = export_as_csv(modeladmin, None, modeladmin.get_queryset(None))
+            lines = b''.join(response.streaming_content).decode().splitlines()
+        self.assertEqual(len(lines), 4)  # header + 3 rows
+        self.assertIn('user_id', lines[0].split(','))
+
+    def test_export_gzipped_when_accepted(self):
+        modeladmin = site._registry[Resume]
+        request = RequestFactory().get('/admin/', HTTP_ACCEPT_ENCODING='gzip, deflate')
+        response = export_as_csv(modeladmin, request, modeladmin.get_queryset(request))
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        lines = gzip.decompress(b''.join(response.streaming_content)).decode().splitlines()
+        self.assertEqual(len(lines), 4)
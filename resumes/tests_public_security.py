@@ -111,3 +111,23 @@ class PublicEndpointSecurityTests(TestCase):
         # Try to access
         response = self.client.get(f'/api/public/c/{link.token}/')
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_public_cover_letter_cached_until_deleted(self):
+        """Repeat public views skip the letter query; a delete drops the cached copy."""
+        cl = CoverLetter.objects.create(user=self.user, title='Shared CL', body='Content')
+        link = ShareService.create_link(self.user, ShareLink.ResourceType.COVER_LETTER, cl.id)
+
+        response = self.client.get(f'/api/public/c/{link.token}/')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        # Only the share link lookup and its last_accessed_at update remain
+        with self.assertNumQueries(2):
+            response = self.client.get(f'/api/public/c/{link.token}/')
+        self.assertEqual(response.data['title'], 'Shared CL')
+
+        owner = APIClient()
+        owner.force_authenticate(user=self.user)
+        owner.delete(f'/api/cover-letters/{cl.id}/')
+
+        response = self.client.get(f'/api/public/c/{link.token}/')
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
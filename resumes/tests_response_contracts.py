@@ -1,12 +1,17 @@
 """
 Tests for response contracts (ensuring correct serializers returned).
 """
-from django.test import TestCase
+import uuid
+from datetime import datetime, timezone
+from decimal import Decimal
+
+from django.test import SimpleTestCase, TestCase
 from django.urls import reverse
 from rest_framework.test import APIClient
 from rest_framework import status
 from django.contrib.auth import get_user_model
 from resumes.models import Template, Resume
+from resumes.renderers import ORJSONRenderer
 
 User = get_user_model()
 
@@ -73,3 +78,27 @@ class ResumeResponseContractTests(TestCase):
         
         # Verify updated title
         self.assertEqual(response.data['title'], 'Fully Updated')
+
+
+class ORJSONRendererContractTests(SimpleTestCase):
+    """Pin the renderer's wire format, including where it differs from JSONRenderer."""
+
+    def test_render_output(self):
+        data = {
+            'id': uuid.UUID('12345678-1234-5678-1234-567812345678'),
+            'when': datetime(2026, 10, 16, 12, 0, 0, 123456, tzinfo=timezone.utc),
+            'text': 'a\u2028b\u2029c',
+            'price': Decimal('1.50'),
+            'ratio': float('nan'),
+        }
+        self.assertEqual(
+            ORJSONRenderer().render(data),
+            b'{"id":"12345678-1234-5678-1234-567812345678",'
+            b'"when":"2026-10-16T12:00:00.123456Z",'
+            b'"text":"a\\u2028b\\u2029c",'
+            b'"price":1.5,'
+            b'"ratio":null}'
+        )
+
+    def test_render_none_is_empty(self):
+        self.assertEqual(ORJSONRenderer().render(None), b'')
@@ -134,7 +134,7 @@ class ResumeViewSet(viewsets.ModelViewSet):
             serializer = ResumeDetailSerializer(new_resume, context={'request': request})
             return Response(serializer.data, status=status.HTTP_201_CREATED)
         except Exception as e:
-            logger.error(f"Failed to duplicate resume {pk}: {e}")
+            logger.error("Failed to duplicate resume %s: %s", pk, e)
             return Response(
                 {"detail": "Failed to duplicate resume"},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -197,7 +197,7 @@ class ResumeViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_503_SERVICE_UNAVAILABLE
             )
         except Exception as e:
-            logger.error(f"PDF generation failed: {e}")
+            logger.error("PDF generation failed: %s", e, exc_info=True)
             return Response(
                 {"detail": "Failed to generate PDF"},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -310,7 +310,7 @@ class ResumeViewSet(viewsets.ModelViewSet):
                 "resume": serializer.data
             })
         except Exception as e:
-            logger.error(f"Failed to restore version: {e}")
+            logger.error("Failed to restore version: %s", e)
             return Response(
                 {"detail": "Failed to restore version"},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -367,7 +367,7 @@ class QuickResumePreviewAPIView(APIView):
                         picture_data = social_account.extra_data.get('picture', {}).get('data', {})
                         user_data['photo_url'] = picture_data.get('url', '')
                 except Exception as e:
-                    logger.warning(f"Failed to get social photo: {e}")
+                    logger.warning("Failed to get social photo: %s", e)
         
         # Generate AI draft
         try:
@@ -386,7 +386,7 @@ class QuickResumePreviewAPIView(APIView):
             }
             
         except Exception as e:
-            logger.error(f"AI generation failed for user {user.email}: {e}")
+            logger.error("AI generation failed for user %s: %s", user.email, e)
             return Response(
                 {
                     "detail": "Failed to generate resume. Please try again.",
@@ -460,7 +460,7 @@ class QuickResumeConfirmAPIView(APIView):
             wizard.mark_consumed()
             
             # Log success
-            logger.info(f"Resume created from wizard {wizard_id} for user {request.user.email}")
+            logger.info("Resume created from wizard %s for user %s", wizard_id, request.user.email)
             
             return Response({
                 "resume_id": str(resume.id),
@@ -469,7 +469,7 @@ class QuickResumeConfirmAPIView(APIView):
             }, status=status.HTTP_201_CREATED)
             
         except Exception as e:
-            logger.error(f"Failed to create resume from wizard {wizard_id}: {e}")
+            logger.error("Failed to create resume from wizard %s: %s", wizard_id, e)
             return Response(
                 {"detail": "Failed to save resume. Please try again."},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -555,7 +555,7 @@ class SectionRewriteAPIView(APIView):
                 )
                 
         except Exception as e:
-            logger.error(f"Section rewrite failed: {e}")
+            logger.error("Section rewrite failed: %s", e)
             return Response(
                 {"detail": "Failed to rewrite section"},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR